@@ -1,30 +1,362 @@
 """Main module for the project."""
 
-import uuid
-from datetime import datetime
+import asyncio
+import io
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import date
+from typing import TYPE_CHECKING
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt, IntPrompt, Confirm, FloatPrompt
 from rich.text import Text
 from rich.table import Table
-import json
 import os
-
-from src.mindsdb_manager import MindsDBManager
-from src.models.paper import Paper
-from src.sample_data_manager import insert_sample_papers
-from src.job_manager import JobManager
+import re
+import sys
+import time
+
+from src.json_codec import parse_metadata
+from src.console import console as default_console
+from src.paper_queue import PaperQueue
+from src.response_cache import normalize_text
+
+if TYPE_CHECKING:
+    from src.models.paper import Paper
+
+SEARCH_CACHE_SIZE = 32
+# Seconds a fetched agent list is reused before asking the server again
+AGENTS_CACHE_TTL = 5.0
+_DEFAULT_LIMIT = 10
+AUTO_INSERT = os.getenv("SCHOLAR_MAP_AUTO_INSERT", "").lower() in ("1", "true", "yes")
+INSERT_POLL_INTERVAL = float(os.getenv("SCHOLAR_MAP_POLL_INTERVAL", "0.1"))
+DEBUG = os.getenv("SCHOLAR_MAP_DEBUG", "").lower() in ("1", "true", "yes")
+EVAL_CONFIG = os.getenv("SCHOLAR_MAP_EVAL_CONFIG")
+_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+_QUICK_ACTIONS_HEADING = Text.from_markup("\n[bold cyan]Quick Actions:[/bold cyan]")
+_INSERT_QUEUE_TMPL = "\n[dim]📄 {count} papers ready to insert[/dim]"
+_HEADER_CACHE = {}
+_Q_USE_THRESHOLD = "🎯 Set relevance threshold?"
+_Q_THRESHOLD = "📊 Threshold (0.0-1.0)"
+_Q_LIMIT = "📑 Max results"
+
+# Menu choices and prompts for each context of get_quick_action
+_MENU_CHOICES = {
+    "main": (
+        "i",
+        "insert",
+        "s",
+        "search",
+        "a",
+        "ai",
+        "ag",
+        "agent",
+        "d",
+        "demo",
+        "j",
+        "job",
+        "e",
+        "eval",
+        "evaluate",
+        "q",
+        "quit",
+    ),
+    "insert": ("a", "add", "r", "review", "i", "insert", "c", "clear", "b", "back"),
+    # Insert menu while the queue is empty, when only adding makes sense
+    "insert_empty": ("a", "add", "b", "back"),
+    "search": (
+        "g",
+        "general",
+        "f",
+        "field",
+        "c",
+        "category",
+        "a",
+        "author",
+        "adv",
+        "advanced",
+        "b",
+        "back",
+    ),
+    "ai": ("s", "summary", "g", "generate", "b", "back"),
+    "agent": ("c", "chat", "l", "list", "d", "delete", "r", "recreate", "b", "back"),
+    "job": ("c", "create", "d", "delete", "s", "status", "b", "back"),
+    "default": ("b", "back"),
+}
+_PROMPT_MARKUP = {
+    "main": "[bold]Action[/bold] ([dim]i[/dim]nsert, [dim]s[/dim]earch, [dim]a[/dim]i, [dim]ag[/dim]ent, [dim]d[/dim]emo, [dim]j[/dim]ob, [dim]e[/dim]val, [dim]q[/dim]uit)",
+    "insert": "[bold]Action[/bold] ([dim]a[/dim]dd, [dim]r[/dim]eview, [dim]i[/dim]nsert, [dim]c[/dim]lear, [dim]b[/dim]ack)",
+    "insert_empty": "[bold]Action[/bold] ([dim]a[/dim]dd, [dim]b[/dim]ack)",
+    "search": "[bold]Search[/bold] ([dim]g[/dim]eneral, [dim]f[/dim]ield, [dim]c[/dim]ategory, [dim]a[/dim]uthor, [dim]adv[/dim]anced, [dim]b[/dim]ack)",
+    "ai": "[bold]AI Features[/bold] ([dim]s[/dim]ummary, [dim]g[/dim]enerate, [dim]b[/dim]ack)",
+    "agent": "[bold]Agent[/bold] ([dim]c[/dim]hat, [dim]l[/dim]ist, [dim]d[/dim]elete, [dim]r[/dim]ecreate, [dim]b[/dim]ack)",
+    "job": "[bold]Job Action[/bold] ([dim]c[/dim]reate, [dim]d[/dim]elete, [dim]s[/dim]tatus, [dim]b[/dim]ack)",
+    "default": "[bold]Action[/bold] ([dim]b[/dim]ack)",
+}
+# context -> (prompt, choices), built once at import. Prompts are parsed to
+# Text, which Prompt.ask copies instead of re-parsing markup. The prompts
+# already list their options, so choices are only checked for membership
+# and a frozenset makes that a hash lookup.
+_CONTEXT_MENUS = {
+    context: (Text.from_markup(_PROMPT_MARKUP[context]), frozenset(choices))
+    for context, choices in _MENU_CHOICES.items()
+}
+
+# Defaults for the knowledge base evaluation settings, used by both the
+# prompts and SCHOLAR_MAP_EVAL_CONFIG files
+_EVAL_DEFAULTS = {
+    "kb_name": "research_papers_kb",
+    "version": "doc_id",
+    "from_sql": "SELECT content FROM my_datasource.my_table",
+    "count": 100,
+    "evaluate": False,
+    "llm_provider": "openai",
+    "llm_model_name": "gpt-4o",
+}
+_EVAL_REQUIRED = ("test_table", "save_to")
+
+# Search menu action -> perform_search type
+_SEARCH_TYPES = {
+    "g": "general",
+    "general": "general",
+    "f": "field",
+    "field": "field",
+    "c": "category",
+    "category": "category",
+    "a": "author",
+    "author": "author",
+    "adv": "advanced",
+    "advanced": "advanced",
+}
+
+_CATEGORY_CHOICES = (
+    "cs.AI",
+    "cs.LG",
+    "cs.CV",
+    "cs.CL",
+    "cs.IR",
+    "cs.NE",
+    "physics",
+    "math",
+    "biology",
+    "other",
+)
+_FIELD_CHOICES = (
+    "Machine Learning",
+    "Computer Vision",
+    "Natural Language Processing",
+    "Artificial Intelligence",
+    "Data Science",
+    "Other",
+)
+_PAPER_TYPE_CHOICES = (
+    "Research Paper",
+    "Review Paper",
+    "Conference Paper",
+    "Journal Article",
+    "Preprint",
+    "Other",
+)
+# Advanced search filters also accept an empty answer to skip the filter
+_CATEGORY_FILTER_CHOICES = _CATEGORY_CHOICES + ("",)
+_FIELD_FILTER_CHOICES = _FIELD_CHOICES + ("",)
+_PAPER_TYPE_FILTER_CHOICES = _PAPER_TYPE_CHOICES + ("",)
+
+
+def _valid_pub_date(text: str) -> bool:
+    """Check that text is a real calendar date in YYYY-MM-DD form"""
+    # fromisoformat also accepts forms like 20240101 or 2024-W01-1, so the
+    # pattern pins the exact layout before the C parser checks the values
+    if not _DATE_RE.fullmatch(text):
+        return False
+    try:
+        date.fromisoformat(text)
+    except ValueError:
+        return False
+    return True
+
+
+def _result_paper_id(result: dict, metadata: dict) -> str:
+    """Find a search result's paper ID, which may sit in several places"""
+    return (
+        result.get("paper_id", "")
+        or result.get("id", "")
+        or metadata.get("paper_id", "")
+    )
+
+
+def _result_columns(results) -> tuple[list[dict], list[str]]:
+    """
+    Parse each search result's metadata and resolve its paper ID.
+
+    DataFrames are read column by column, so only the columns used here are
+    turned into Python objects rather than a dict for every row.
+    """
+    if not hasattr(results, "columns"):
+        metadata = [parse_metadata(result.get("metadata")) for result in results]
+        paper_ids = [_result_paper_id(r, m) for r, m in zip(results, metadata)]
+        return metadata, paper_ids
+
+    missing = [""] * len(results)
+
+    def column(name: str) -> list:
+        return results[name].tolist() if name in results.columns else missing
+
+    metadata = list(map(parse_metadata, column("metadata")))
+    paper_ids = [
+        paper_id or row_id or meta.get("paper_id", "")
+        for paper_id, row_id, meta in zip(column("paper_id"), column("id"), metadata)
+    ]
+    return metadata, paper_ids
+
+
+def _load_eval_config(path: str) -> dict:
+    """
+    Read knowledge base evaluation settings from a TOML file.
+
+    Keys are named after the evaluation prompts. Omitted keys take the
+    prompt defaults, except test_table and save_to, which are required.
+    """
+    import tomllib
+
+    with open(path, "rb") as f:
+        config = tomllib.load(f)
+
+    unknown = config.keys() - _EVAL_DEFAULTS.keys() - {"llm_api_key", *_EVAL_REQUIRED}
+    if unknown:
+        raise ValueError(f"unknown keys in {path}: {', '.join(sorted(unknown))}")
+    missing = [key for key in _EVAL_REQUIRED if key not in config]
+    if missing:
+        raise ValueError(f"{path} is missing {', '.join(missing)}")
+
+    return {
+        **_EVAL_DEFAULTS,
+        "llm_api_key": os.environ.get("OPENAI_API_KEY", ""),
+        **config,
+    }
+
+
+def _search_key(method: str, args: tuple, filters: dict) -> tuple:
+    """
+    Cache key for a search, with the query text normalized.
+
+    Every search method takes the query first. Case, spacing and trailing
+    punctuation make no difference to the semantic match, so such variants
+    share one cache entry.
+    """
+    query, *rest = args
+    return (method, (normalize_text(query), *rest), tuple(sorted(filters.items())))
+
+
+def _dedup_key(paper: "Paper") -> tuple:
+    """Key used to detect the same paper being queued twice"""
+    return (
+        paper.title.strip().lower(),
+        paper.authors.strip().lower(),
+        paper.pub_date,
+    )
 
 
 class ScholarMapCLI:
     """Enhanced CLI interface for Scholar Map"""
 
-    def __init__(self):
-        self.console = Console()
-        self.manager = MindsDBManager()
-        self.job_manager = JobManager(self.manager)
+    def __init__(
+        self,
+        batch_size: int = None,
+        concurrency: int = None,
+        console: Console = None,
+    ):
+        self.console = console if console is not None else default_console
+        # Created in run() so the MindsDB SDK import does not delay the header
+        self.manager = None
+        self.job_manager = None
         self.current_context = "main"
-        self.papers_to_insert = []
+        # Insert tuning knobs; unset values fall back to MindsDBManager defaults
+        self.insert_options = {
+            key: value
+            for key, value in (("batch_size", batch_size), ("concurrency", concurrency))
+            if value is not None
+        }
+        self.papers_to_insert = deque()
+        # Mirrors papers_to_insert on disk so queued input survives a crash
+        self.paper_queue = PaperQueue()
+        self._seen_keys = set()
+        # IDs generated this session and not yet sent, which cannot already
+        # be in the knowledge base
+        self._fresh_ids = set()
+        # Inserts run on a worker thread; holds (future, papers) while one runs
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending_insert = None
+        # Batches added papers in the background when auto-insert is enabled
+        self.firehose = None
+        # (method, args, filters) -> results of recent searches
+        self._search_cache = {}
+        # Runs speculative searches while search options are being entered
+        self._search_executor = ThreadPoolExecutor(max_workers=2)
+        # (fetch time, agents) from the last list_agents call
+        self._agents_cache = (0.0, None)
+        self._queue_status_count = -1
+        self._queue_status_text = None
+        self._header_panel = Panel(
+            Text("Scholar Map", style="bold blue"),
+            subtitle="Research Paper Knowledge Management System",
+            border_style="blue",
+            padding=(0, 2),
+        )
+
+        # Action -> handler tables; an action missing from a table (back or
+        # quit) leaves that menu loop
+        self._main_actions = {
+            "i": self.handle_insert_papers,
+            "insert": self.handle_insert_papers,
+            "s": self.handle_search_papers,
+            "search": self.handle_search_papers,
+            "a": self.handle_ai_features,
+            "ai": self.handle_ai_features,
+            "ag": self.handle_agent_features,
+            "agent": self.handle_agent_features,
+            "d": self.load_demo_data,
+            "demo": self.load_demo_data,
+            "j": self.handle_job_management,
+            "job": self.handle_job_management,
+            "e": self.handle_evaluate_knowledge_base,
+            "eval": self.handle_evaluate_knowledge_base,
+            "evaluate": self.handle_evaluate_knowledge_base,
+        }
+        self._insert_actions = {
+            "a": self.add_paper,
+            "add": self.add_paper,
+            "r": self.review_papers,
+            "review": self.review_papers,
+            "i": self.insert_queued_papers,
+            "insert": self.insert_queued_papers,
+            "c": self.clear_papers,
+            "clear": self.clear_papers,
+        }
+        self._job_actions = {
+            "c": self.create_job,
+            "create": self.create_job,
+            "d": self.delete_job,
+            "delete": self.delete_job,
+            "s": self.show_job_status,
+            "status": self.show_job_status,
+        }
+        self._ai_actions = {
+            "s": self.view_paper_summary,
+            "summary": self.view_paper_summary,
+            "g": self.generate_summary_for_paper,
+            "generate": self.generate_summary_for_paper,
+        }
+        self._agent_actions = {
+            "c": self.chat_with_agent,
+            "chat": self.chat_with_agent,
+            "l": self.list_agents,
+            "list": self.list_agents,
+            "d": self.delete_agent,
+            "delete": self.delete_agent,
+            "r": self.recreate_agent,
+            "recreate": self.recreate_agent,
+        }
 
     def clear_screen(self):
         """Clear the terminal screen"""
@@ -32,107 +364,109 @@ class ScholarMapCLI:
 
     def show_header(self):
         """Display the application header"""
-        welcome_text = Text("Scholar Map", style="bold blue")
-        welcome_panel = Panel(
-            welcome_text,
-            subtitle="Research Paper Knowledge Management System",
-            border_style="blue",
-            padding=(0, 2),
-        )
-        self.console.print(welcome_panel)
+        # The header is static, so lay it out once per terminal width and
+        # write the rendered text directly afterwards
+        key = (self.console.width, self.console.color_system)
+        rendered = _HEADER_CACHE.get(key)
+        if rendered is None:
+            with self.console.capture() as capture:
+                self.console.print(self._header_panel)
+            rendered = _HEADER_CACHE[key] = capture.get()
+        self.console.file.write(rendered)
+        self.console.file.flush()
 
     def show_status(self, message: str, style: str = "dim"):
         """Show a status message"""
         self.console.print(f"[{style}]{message}[/{style}]")
 
+    def resume_queued_papers(self):
+        """Offer to restore papers queued but not inserted in a previous session"""
+        papers = self.paper_queue.load()
+        if not papers:
+            return
+
+        if Confirm.ask(
+            f"📄 Resume {len(papers)} queued papers from your last session?",
+            default=True,
+        ):
+            self.papers_to_insert.extend(papers)
+            self._seen_keys.update(map(_dedup_key, papers))
+        else:
+            self.paper_queue.clear()
+
     def get_quick_action(self, context: str = "main") -> str:
         """Get next action from user with minimal interface"""
         if context == "main":
-            self.console.print("\n[bold cyan]Quick Actions:[/bold cyan]")
-            prompt_text = "[bold]Action[/bold] ([dim]i[/dim]nsert, [dim]s[/dim]earch, [dim]a[/dim]i, [dim]ag[/dim]ent, [dim]d[/dim]emo, [dim]j[/dim]ob, [dim]q[/dim]uit)"
-            choices = [
-                "i",
-                "insert",
-                "s",
-                "search",
-                "a",
-                "ai",
-                "ag",
-                "agent",
-                "d",
-                "demo",
-                "j",
-                "job",
-                "q",
-                "quit",
-            ]
+            self.console.print(_QUICK_ACTIONS_HEADING)
         elif context == "insert":
-            if self.papers_to_insert:
-                self.console.print(
-                    f"\n[dim]📄 {len(self.papers_to_insert)} papers ready to insert[/dim]"
-                )
-            prompt_text = "[bold]Action[/bold] ([dim]a[/dim]dd, [dim]r[/dim]eview, [dim]i[/dim]nsert, [dim]c[/dim]lear, [dim]b[/dim]ack)"
-            choices = [
-                "a",
-                "add",
-                "r",
-                "review",
-                "i",
-                "insert",
-                "c",
-                "clear",
-                "b",
-                "back",
-            ]
-        elif context == "search":
-            prompt_text = "[bold]Search[/bold] ([dim]g[/dim]eneral, [dim]f[/dim]ield, [dim]c[/dim]ategory, [dim]a[/dim]uthor, [dim]adv[/dim]anced, [dim]b[/dim]ack)"
-            choices = [
-                "g",
-                "general",
-                "f",
-                "field",
-                "c",
-                "category",
-                "a",
-                "author",
-                "adv",
-                "advanced",
-                "b",
-                "back",
-            ]
-        elif context == "ai":
-            prompt_text = "[bold]AI Features[/bold] ([dim]s[/dim]ummary, [dim]g[/dim]enerate, [dim]b[/dim]ack)"
-            choices = ["s", "summary", "g", "generate", "b", "back"]
-        elif context == "agent":
-            prompt_text = "[bold]Agent[/bold] ([dim]c[/dim]hat, [dim]l[/dim]ist, [dim]d[/dim]elete, [dim]r[/dim]ecreate, [dim]b[/dim]ack)"
-            choices = [
-                "c",
-                "chat",
-                "l",
-                "list",
-                "d",
-                "delete",
-                "r",
-                "recreate",
-                "b",
-                "back",
-            ]
-        elif context == "job":
-            prompt_text = "[bold]Job Action[/bold] ([dim]c[/dim]reate, [dim]d[/dim]elete, [dim]s[/dim]tatus, [dim]b[/dim]ack)"
-            choices = ["c", "create", "d", "delete", "s", "status", "b", "back"]
-        else:
-            choices = ["b", "back"]
-            prompt_text = "[bold]Action[/bold] ([dim]b[/dim]ack)"
+            count = len(self.papers_to_insert)
+            if count:
+                # Only re-parse the status markup when the queue size changes
+                if count != self._queue_status_count:
+                    self._queue_status_text = Text.from_markup(
+                        _INSERT_QUEUE_TMPL.format(count=count)
+                    )
+                    self._queue_status_count = count
+                self.console.print(self._queue_status_text)
+            else:
+                # Review, insert and clear have nothing to work on yet
+                context = "insert_empty"
 
-        return Prompt.ask(prompt_text, choices=choices, default="b")
+        prompt_text, choices = _CONTEXT_MENUS.get(context, _CONTEXT_MENUS["default"])
+        return self.read_choice(prompt_text, choices, default="b")
 
-    def collect_paper_info(self) -> Paper:
+    def read_choice(self, prompt_text: Text, choices: frozenset, default: str) -> str:
+        """Read a menu choice, reading piped input directly from sys.stdin"""
+        if sys.stdin.isatty():
+            return Prompt.ask(
+                prompt_text, choices=choices, default=default, show_choices=False
+            )
+
+        # Rich's prompt goes through input() and re-renders the choice list on
+        # every call; for piped input a plain readline is enough
+        while True:
+            self.console.print(
+                prompt_text, Text(f"({default})", style="prompt.default"), end=": "
+            )
+            line = sys.stdin.readline()
+            if not line:
+                raise EOFError
+            value = line.strip()
+            if not value:
+                return default
+            if value in choices:
+                return value
+            self.console.print(
+                "[prompt.invalid.choice]Please select one of the available options"
+            )
+
+    def read_abstract(self) -> str:
+        """Read a multi-line abstract, terminated by two blank lines or EOF"""
+        self.console.print(
+            "\n📝 [bold]Abstract[/bold] [dim](Enter text, then press Enter twice or Ctrl-D when done)[/dim]"
+        )
+        # Read straight from sys.stdin instead of calling input() per line, which
+        # is much faster for pasted or piped text
+        buffer = io.StringIO()
+        previous_blank = False
+        for line in iter(sys.stdin.readline, ""):
+            blank = line.isspace()
+            if blank and previous_blank:
+                break
+            previous_blank = blank
+            buffer.write(line)
+
+        return buffer.getvalue().strip()
+
+    def collect_paper_info(self) -> "Paper":
         """Collect paper information from user input with improved UX"""
+        from src.models.paper import Paper, new_paper_id
+
         self.console.print("\n[bold cyan]📝 New Paper Entry[/bold cyan]")
         self.console.print("[dim]Fill in the details (press Ctrl+C to cancel)[/dim]\n")
 
         # Generate unique paper ID
-        paper_id = str(uuid.uuid4())
+        paper_id = new_paper_id()
 
         try:
             # Collect required information with streamlined prompts
@@ -141,34 +475,22 @@ class ScholarMapCLI:
 
             category = Prompt.ask(
                 "🏷️ [bold]Category[/bold]",
-                choices=[
-                    "cs.AI",
-                    "cs.LG",
-                    "cs.CV",
-                    "cs.CL",
-                    "cs.IR",
-                    "cs.NE",
-                    "physics",
-                    "math",
-                    "biology",
-                    "other",
-                ],
+                choices=_CATEGORY_CHOICES,
                 default="other",
             )
 
             # Date input with validation
+            today = date.today().isoformat()
             while True:
                 pub_date_str = Prompt.ask(
                     "📅 [bold]Publication Date[/bold] [dim](YYYY-MM-DD or press Enter for today)[/dim]",
-                    default=datetime.now().strftime("%Y-%m-%d"),
+                    default=today,
                 )
-                try:
-                    datetime.strptime(pub_date_str, "%Y-%m-%d")
+                if _valid_pub_date(pub_date_str):
                     break
-                except ValueError:
-                    self.console.print(
-                        "[red]❌ Invalid date format. Please use YYYY-MM-DD[/red]"
-                    )
+                self.console.print(
+                    "[red]❌ Invalid date format. Please use YYYY-MM-DD[/red]"
+                )
 
             arxiv_id = Prompt.ask(
                 "🔬 [bold]ArXiv ID[/bold] [dim](optional)[/dim]", default=""
@@ -179,27 +501,13 @@ class ScholarMapCLI:
 
             research_field = Prompt.ask(
                 "🔍 [bold]Research Field[/bold]",
-                choices=[
-                    "Machine Learning",
-                    "Computer Vision",
-                    "Natural Language Processing",
-                    "Artificial Intelligence",
-                    "Data Science",
-                    "Other",
-                ],
+                choices=_FIELD_CHOICES,
                 default="Other",
             )
 
             paper_type = Prompt.ask(
                 "📋 [bold]Paper Type[/bold]",
-                choices=[
-                    "Research Paper",
-                    "Review Paper",
-                    "Conference Paper",
-                    "Journal Article",
-                    "Preprint",
-                    "Other",
-                ],
+                choices=_PAPER_TYPE_CHOICES,
                 default="Research Paper",
             )
 
@@ -207,33 +515,21 @@ class ScholarMapCLI:
                 "📊 [bold]Citation Count[/bold] [dim](optional)[/dim]", default=0
             )
 
-            self.console.print(
-                "\n📝 [bold]Abstract[/bold] [dim](Enter text, then press Enter twice when done)[/dim]"
-            )
-            abstract_lines = []
-            while True:
-                line = input()
-                if line.strip() == "":
-                    if abstract_lines and abstract_lines[-1].strip() == "":
-                        break
-                    abstract_lines.append(line)
-                else:
-                    abstract_lines.append(line)
-
-            abstract = "\n".join(abstract_lines).strip()
+            abstract = self.read_abstract()
 
+            # Positional arguments in Paper field order
             return Paper(
-                paper_id=paper_id,
-                title=title,
-                authors=authors,
-                category=category,
-                pub_date=pub_date_str,
-                arxiv_id=arxiv_id,
-                journal=journal,
-                research_field=research_field,
-                paper_type=paper_type,
-                citation_count=citation_count,
-                abstract=abstract,
+                paper_id,
+                title,
+                authors,
+                category,
+                pub_date_str,
+                arxiv_id,
+                journal,
+                research_field,
+                paper_type,
+                citation_count,
+                abstract,
             )
 
         except KeyboardInterrupt:
@@ -242,151 +538,386 @@ class ScholarMapCLI:
 
     def handle_insert_papers(self):
         """Handle paper insertion with improved workflow"""
+        from src.models.paper import prefill_paper_ids
+
         self.current_context = "insert"
+        prefill_paper_ids()
 
         while True:
-            action = self.get_quick_action("insert")
+            if self._pending_insert is not None and self._pending_insert[0].done():
+                self._finish_insert()
+            self._apply_auto_inserts()
+            handler = self._insert_actions.get(self.get_quick_action("insert"))
+            if handler is None:
+                # Queued papers are already persisted, so leaving loses nothing
+                self._flush_auto_inserts()
+                break
+            handler()
 
-            if action in ["a", "add"]:
-                paper = self.collect_paper_info()
-                if paper:
-                    self.papers_to_insert.append(paper)
-                    self.console.print(
-                        f"[bold green]✅ Added '[bold]{paper.title}[/bold]'[/bold green]"
-                    )
+    def add_paper(self):
+        """Collect a new paper and add it to the insert queue"""
+        paper = self.collect_paper_info()
+        if not paper:
+            return
 
-            elif action in ["r", "review"]:
-                if not self.papers_to_insert:
-                    self.console.print("[yellow]📭 No papers to review[/yellow]")
-                    continue
+        key = _dedup_key(paper)
+        if key in self._seen_keys:
+            self.console.print(
+                f"[yellow]⚠️ '{paper.title}' is already queued, skipping[/yellow]"
+            )
+            return
+        self._seen_keys.add(key)
+        self._fresh_ids.add(paper.paper_id)
+        self.papers_to_insert.append(paper)
+        self.paper_queue.append(paper)
+        if self.firehose is not None:
+            self.firehose.submit(paper)
+        # Warm the preview cache so reviews only do lookups
+        paper.abstract_preview
+        self.console.print(
+            f"[bold green]✅ Added '[bold]{paper.title}[/bold]'[/bold green]"
+        )
 
+    def review_papers(self):
+        """Show the papers waiting to be inserted"""
+        n = len(self.papers_to_insert)
+        if not n:
+            self.console.print("[yellow]📭 No papers to review[/yellow]")
+            return
+
+        # One table laid out and flushed once, rather than a print per paper
+        table = Table(
+            title=f"📋 Review Queue ({n} papers)",
+            show_header=True,
+            header_style="bold magenta",
+            show_lines=True,
+        )
+        table.add_column("#", style="bold blue", justify="right")
+        table.add_column("Title", style="bold")
+        table.add_column("Authors")
+        table.add_column("Category / Field")
+        table.add_column("Date")
+        table.add_column("Abstract", style="dim")
+        for i, paper in enumerate(self.papers_to_insert, 1):
+            # Plain Text cells skip markup parsing of user-entered values
+            table.add_row(
+                str(i),
+                Text(paper.title),
+                Text(paper.authors),
+                Text(f"{paper.category} | {paper.research_field}"),
+                Text(paper.pub_date),
+                Text(paper.abstract_preview),
+            )
+        self.console.print(table)
+
+    def insert_queued_papers(self):
+        """Insert every queued paper into the knowledge base"""
+        if self._pending_insert is not None:
+            if not self._pending_insert[0].done():
                 self.console.print(
-                    f"\n[bold cyan]📋 Review Queue ({len(self.papers_to_insert)} papers)[/bold cyan]"
+                    "[yellow]⏳ The previous insertion is still running[/yellow]"
                 )
-                for i, paper in enumerate(self.papers_to_insert, 1):
-                    self.console.print(
-                        f"\n[bold blue]{i}.[/bold blue] [bold]{paper.title}[/bold]"
-                    )
-                    self.console.print(f"   👥 {paper.authors}")
-                    self.console.print(
-                        f"   🏷️ {paper.category} | 🔍 {paper.research_field}"
-                    )
-                    self.console.print(f"   📅 {paper.pub_date}")
-                    abstract_preview = (
-                        paper.abstract[:150] + "..."
-                        if len(paper.abstract) > 150
-                        else paper.abstract
-                    )
-                    self.console.print(f"   📝 {abstract_preview}")
+                return
+            self._finish_insert()
+        # Let auto-insert finish first so no paper is sent twice
+        self._flush_auto_inserts()
 
-            elif action in ["i", "insert"]:
-                if not self.papers_to_insert:
-                    self.console.print("[yellow]📭 No papers to insert[/yellow]")
-                    continue
+        n = len(self.papers_to_insert)
+        if not n:
+            self.console.print("[yellow]📭 No papers to insert[/yellow]")
+            return
+
+        self.console.print(
+            f"\n[bold yellow]🚀 Ready to insert {n} papers[/bold yellow]"
+        )
+        if not Confirm.ask("Proceed with insertion?", default=True):
+            return
+
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
+        # The manager slices its input into batches, which a deque cannot do
+        papers = list(self.papers_to_insert)
+        # The display belongs to this thread so Ctrl+C can take it down; the
+        # worker only advances it and prints nothing itself
+        progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=self.console,
+            refresh_per_second=4,
+            transient=True,
+        )
+        task = progress.add_task(
+            "Processing and inserting papers into knowledge base...",
+            total=len(papers),
+        )
+        future = self._executor.submit(self._insert_in_worker, papers, progress, task)
+        self._pending_insert = (future, papers)
+        try:
+            # Poll rather than block so Ctrl+C can hand the menu back while
+            # the insert keeps running on the worker thread
+            with progress:
+                while not future.done():
+                    wait((future,), timeout=INSERT_POLL_INTERVAL)
+        except KeyboardInterrupt:
+            self.console.print(
+                "\n[yellow]⏳ Insertion continues in the background; "
+                "the papers stay queued until it finishes[/yellow]"
+            )
+            return
+        self._finish_insert()
+
+    def _take_fresh_ids(self, papers: list) -> set:
+        """Claim the IDs among papers that were generated this session"""
+        # After one attempt the server may hold a paper even if the insert
+        # reported failure, so an ID only skips the existing-ID lookup once
+        fresh = {
+            paper.paper_id for paper in papers if paper.paper_id in self._fresh_ids
+        }
+        self._fresh_ids.difference_update(fresh)
+        return fresh
+
+    def _insert_in_worker(self, papers: list, progress, task) -> list:
+        """Run a quiet insert on the worker thread, advancing the given display"""
+        return asyncio.run(
+            self.manager.insert_papers_async(
+                papers,
+                progress=progress,
+                task=task,
+                quiet=True,
+                new_ids=self._take_fresh_ids(papers),
+                **self.insert_options,
+            )
+        )
+
+    def _wait_for_pending_insert(self):
+        """Wait for a backgrounded insert so its stored papers leave the queue"""
+        if self._pending_insert is None:
+            return
+        if not self._pending_insert[0].done():
+            self.console.print(
+                "[yellow]⏳ Waiting for the background insertion to finish...[/yellow]"
+            )
+        self._finish_insert()
+
+    def _finish_insert(self):
+        """Apply the outcome of the insert running on the worker thread"""
+        future, papers = self._pending_insert
+        self._pending_insert = None
+        try:
+            failed = future.result()
+        except Exception as e:
+            self.console.print(f"[red]❌ Insertion error: {str(e)}[/red]")
+            return
+
+        if not failed:
+            self.console.print(
+                "[bold green]✅ All papers inserted successfully![/bold green]"
+            )
+        else:
+            # Failed papers stay queued; the ones already stored are not
+            # retried, so a second insert cannot duplicate them
+            self.console.print(
+                f"[red]❌ {len(failed)} papers failed to insert and remain queued[/red]"
+            )
+        self._apply_insert_result(papers, failed)
+
+    def _apply_insert_result(self, papers: list, failed: list):
+        """Drop the papers an insert stored from the queue and list the failures"""
+        # Inserts run quietly off the main thread, so failures are only
+        # reported here, between prompts
+        for i in failed:
+            self.console.print(Text(f"   • {papers[i].title}", style="red"))
+        # Match by identity: papers may have been added or cleared while the
+        # insert ran in the background
+        failed_indices = set(failed)
+        inserted = {
+            id(paper) for i, paper in enumerate(papers) if i not in failed_indices
+        }
+        self.papers_to_insert = deque(
+            paper for paper in self.papers_to_insert if id(paper) not in inserted
+        )
+        self._seen_keys = set(map(_dedup_key, self.papers_to_insert))
+        # Newly stored papers can change the results of any earlier search
+        # and the agent's answers
+        if len(failed) < len(papers):
+            self._search_cache.clear()
+            self.manager.answer_cache.clear()
+        if self.papers_to_insert:
+            self.paper_queue.replace(self.papers_to_insert)
+        else:
+            self.paper_queue.clear()
+
+    def _insert_quietly(self, papers: list) -> list:
+        """Insert a batch for the auto-insert worker without drawing output"""
+        return self.manager.insert_papers(
+            papers,
+            quiet=True,
+            new_ids=self._take_fresh_ids(papers),
+            **self.insert_options,
+        )
 
+    def _apply_auto_inserts(self):
+        """Apply batches the auto-insert worker has finished"""
+        if self.firehose is None:
+            return
+        while not self.firehose.completed.empty():
+            papers, failed = self.firehose.completed.get_nowait()
+            if len(failed) < len(papers):
                 self.console.print(
-                    f"\n[bold yellow]🚀 Ready to insert {len(self.papers_to_insert)} papers[/bold yellow]"
+                    f"[dim]📤 Auto-inserted {len(papers) - len(failed)} papers[/dim]"
                 )
-                if Confirm.ask("Proceed with insertion?", default=True):
-                    success = self.manager.insert_papers(self.papers_to_insert)
-                    if success:
-                        self.papers_to_insert.clear()
-                        self.console.print(
-                            "[bold green]✅ All papers inserted successfully![/bold green]"
-                        )
-                    else:
-                        self.console.print("[red]❌ Some papers failed to insert[/red]")
-
-            elif action in ["c", "clear"]:
-                if self.papers_to_insert and Confirm.ask(
-                    f"Clear all {len(self.papers_to_insert)} papers?", default=False
-                ):
-                    self.papers_to_insert.clear()
-                    self.console.print("[yellow]🗑️ Papers cleared[/yellow]")
-
-            elif action in ["b", "back"]:
-                if self.papers_to_insert and not Confirm.ask(
-                    f"You have {len(self.papers_to_insert)} unsaved papers. Return anyway?",
-                    default=False,
-                ):
-                    continue
-                break
+            if failed:
+                self.console.print(
+                    f"[red]❌ {len(failed)} papers failed to auto-insert and remain queued[/red]"
+                )
+            self._apply_insert_result(papers, failed)
+
+    def _flush_auto_inserts(self):
+        """Wait for the auto-insert worker to insert everything submitted"""
+        if self.firehose is not None:
+            self.firehose.flush()
+            self._apply_auto_inserts()
+
+    def clear_papers(self):
+        """Discard every queued paper after confirmation"""
+        # Papers already handed to auto-insert cannot be recalled
+        self._flush_auto_inserts()
+        n = len(self.papers_to_insert)
+        if n and Confirm.ask(f"Clear all {n} papers?", default=False):
+            self.papers_to_insert.clear()
+            self._seen_keys.clear()
+            self.paper_queue.clear()
+            self.console.print("[yellow]🗑️ Papers cleared[/yellow]")
+
+    def _ask_threshold_and_limit(self) -> tuple[float | None, int]:
+        """Ask for the optional relevance threshold and result limit"""
+        threshold = (
+            FloatPrompt.ask(_Q_THRESHOLD, default=0.3)
+            if Confirm.ask(_Q_USE_THRESHOLD, default=False)
+            else None
+        )
+        return threshold, IntPrompt.ask(_Q_LIMIT, default=_DEFAULT_LIMIT)
+
+    def cached_search(self, method: str, *args, prefetched=None, **filters):
+        """
+        Run a MindsDBManager search method, reusing recent identical results.
+
+        Empty results are not cached, since the manager also returns an
+        empty list when a search fails.
+
+        Args:
+            method: Name of the MindsDBManager search method
+            prefetched: Optional future already running this exact search
+                quietly in the background
+        """
+        key = _search_key(method, args, filters)
+        results = self._search_cache.pop(key, None)
+        if results is None:
+            if prefetched is not None:
+                results = prefetched.result()
+            if prefetched is None or len(results) == 0:
+                # Background searches print nothing, so an empty result may
+                # hide an error; repeat it here where the error can be shown
+                results = getattr(self.manager, method)(*args, **filters)
+            if len(results) == 0:
+                return results
+            if len(self._search_cache) >= SEARCH_CACHE_SIZE:
+                # Dicts keep insertion order, so the first key is the oldest
+                del self._search_cache[next(iter(self._search_cache))]
+        # Re-inserting marks the entry as most recently used
+        self._search_cache[key] = results
+        return results
 
     def perform_search(self, search_type: str):
         """Perform different types of searches with streamlined interface"""
         self.console.print(f"\n[bold cyan]🔍 {search_type.title()} Search[/bold cyan]")
 
+        # Each search method takes these leading arguments, then threshold
+        # and limit
         if search_type == "general":
             query = Prompt.ask("💭 [bold]Search query[/bold]")
+            method, leading = "search_papers", (query,)
 
         elif search_type == "field":
-            field_choices = [
-                "Machine Learning",
-                "Computer Vision",
-                "Natural Language Processing",
-                "Artificial Intelligence",
-                "Data Science",
-                "Other",
-            ]
-            field = Prompt.ask("🔍 [bold]Research field[/bold]", choices=field_choices)
+            field = Prompt.ask("🔍 [bold]Research field[/bold]", choices=_FIELD_CHOICES)
             query = Prompt.ask("💭 [bold]Search query[/bold]")
+            method, leading = "search_by_research_field", (query, field)
 
         elif search_type == "category":
-            category_choices = [
-                "cs.AI",
-                "cs.LG",
-                "cs.CV",
-                "cs.CL",
-                "cs.IR",
-                "cs.NE",
-                "physics",
-                "math",
-                "biology",
-                "other",
-            ]
-            category = Prompt.ask("🏷️ [bold]Category[/bold]", choices=category_choices)
+            category = Prompt.ask("🏷️ [bold]Category[/bold]", choices=_CATEGORY_CHOICES)
             query = Prompt.ask("💭 [bold]Search query[/bold]")
+            method, leading = "search_by_category", (query, category)
 
         elif search_type == "author":
             author = Prompt.ask(
                 "👥 [bold]Author name[/bold] [dim](partial match supported)[/dim]"
             )
             query = Prompt.ask("💭 [bold]Search query[/bold]")
+            method, leading = "search_by_author", (query, author)
 
         elif search_type == "advanced":
             return self.advanced_search()
 
+        # Most searches keep the default options, so start that search now and
+        # let it run while the options are being asked
+        default_args = (*leading, None, _DEFAULT_LIMIT)
+        prefetch = None
+        if _search_key(method, default_args, {}) not in self._search_cache:
+            # Quiet, so a failure cannot print into the prompts that follow
+            prefetch = self._search_executor.submit(
+                getattr(self.manager, method), *default_args, quiet=True
+            )
+
         # Common search options
-        use_threshold = Confirm.ask("🎯 Set relevance threshold?", default=False)
-        threshold = (
-            FloatPrompt.ask("📊 Threshold (0.0-1.0)", default=0.3)
-            if use_threshold
-            else None
-        )
-        limit = IntPrompt.ask("📑 Max results", default=10)
+        threshold, limit = self._ask_threshold_and_limit()
 
         # Perform search based on type
         self.show_status(f"Searching...")
-        results = []
         try:
-            if search_type == "general":
-                results = self.manager.search_papers(query, threshold, limit)
-            elif search_type == "field":
-                results = self.manager.search_by_research_field(
-                    query, field, threshold, limit
-                )
-            elif search_type == "category":
-                results = self.manager.search_by_category(
-                    query, category, threshold, limit
+            if prefetch is not None and (threshold, limit) == (None, _DEFAULT_LIMIT):
+                results = self.cached_search(method, *default_args, prefetched=prefetch)
+            elif prefetch is not None and threshold is None and limit > _DEFAULT_LIMIT:
+                results = self._search_with_preview(
+                    method, leading, limit, prefetch, query
                 )
-            elif search_type == "author":
-                results = self.manager.search_by_author(query, author, threshold, limit)
+            else:
+                if prefetch is not None:
+                    prefetch.cancel()
+                results = self.cached_search(method, *leading, threshold, limit)
 
             self.manager.display_search_results(results, query)
 
         except Exception as e:
             self.console.print(f"[red]❌ Search error: {str(e)}[/red]")
 
+    def _search_with_preview(
+        self, method: str, leading: tuple, limit: int, prefetch, query: str
+    ):
+        """
+        Run a larger search while showing the prefetched top results.
+
+        Results are ordered by relevance, so the default-limit search already
+        running is the head of the larger one. It is shown as soon as it
+        arrives and replaced by the full table once that query returns.
+        """
+        full = self._search_executor.submit(
+            getattr(self.manager, method), *leading, None, limit, quiet=True
+        )
+        top = self.cached_search(
+            method, *leading, None, _DEFAULT_LIMIT, prefetched=prefetch
+        )
+        if len(top) > 0 and not full.done():
+            from rich.console import Group
+            from rich.live import Live
+
+            preview = Group(
+                self.manager.search_results_table(top),
+                Text(f"Fetching up to {limit} results...", style="dim"),
+            )
+            with Live(preview, console=self.console, transient=True):
+                wait([full])
+        return self.cached_search(method, *leading, None, limit, prefetched=full)
+
     def advanced_search(self):
         """Handle advanced search with multiple filters"""
         self.console.print("\n[bold cyan]🔧 Advanced Search[/bold cyan]")
@@ -400,15 +931,7 @@ class ScholarMapCLI:
         # Research field filter
         research_field = Prompt.ask(
             "🔍 Research field",
-            choices=[
-                "Machine Learning",
-                "Computer Vision",
-                "Natural Language Processing",
-                "Artificial Intelligence",
-                "Data Science",
-                "Other",
-                "",
-            ],
+            choices=_FIELD_FILTER_CHOICES,
             default="",
         )
         if research_field:
@@ -417,19 +940,7 @@ class ScholarMapCLI:
         # Category filter
         category = Prompt.ask(
             "🏷️ Category",
-            choices=[
-                "cs.AI",
-                "cs.LG",
-                "cs.CV",
-                "cs.CL",
-                "cs.IR",
-                "cs.NE",
-                "physics",
-                "math",
-                "biology",
-                "other",
-                "",
-            ],
+            choices=_CATEGORY_FILTER_CHOICES,
             default="",
         )
         if category:
@@ -438,40 +949,28 @@ class ScholarMapCLI:
         # Paper type filter
         paper_type = Prompt.ask(
             "📋 Paper type",
-            choices=[
-                "Research Paper",
-                "Review Paper",
-                "Conference Paper",
-                "Journal Article",
-                "Preprint",
-                "Other",
-                "",
-            ],
+            choices=_PAPER_TYPE_FILTER_CHOICES,
             default="",
         )
         if paper_type:
             filters["paper_type"] = paper_type
 
         # Minimum citation count
-        min_citations = Prompt.ask("📊 Min citations", default="")
-        if min_citations.isdigit():
-            filters["citation_count"] = int(min_citations)
+        min_citations = IntPrompt.ask("📊 Min citations (-1 to skip)", default=-1)
+        if min_citations >= 0:
+            filters["citation_count"] = min_citations
 
         # Search options
-        use_threshold = Confirm.ask("🎯 Set relevance threshold?", default=False)
-        threshold = (
-            FloatPrompt.ask("📊 Threshold (0.0-1.0)", default=0.3)
-            if use_threshold
-            else None
-        )
-        limit = IntPrompt.ask("📑 Max results", default=10)
+        threshold, limit = self._ask_threshold_and_limit()
 
         self.show_status("Performing advanced search...")
         if filters:
             self.show_status(f"Filters: {filters}")
 
         try:
-            results = self.manager.search_papers(query, threshold, limit, **filters)
+            results = self.cached_search(
+                "search_papers", query, threshold, limit, **filters
+            )
             self.manager.display_search_results(results, f"{query} (Advanced)")
         except Exception as e:
             self.console.print(f"[red]❌ Search error: {str(e)}[/red]")
@@ -481,76 +980,57 @@ class ScholarMapCLI:
         self.current_context = "search"
 
         while True:
-            action = self.get_quick_action("search")
-
-            if action in ["g", "general"]:
-                self.perform_search("general")
-            elif action in ["f", "field"]:
-                self.perform_search("field")
-            elif action in ["c", "category"]:
-                self.perform_search("category")
-            elif action in ["a", "author"]:
-                self.perform_search("author")
-            elif action in ["adv", "advanced"]:
-                self.perform_search("advanced")
-            elif action in ["b", "back"]:
+            search_type = _SEARCH_TYPES.get(self.get_quick_action("search"))
+            if search_type is None:
+                # Leaving search drops cached results so the next visit is fresh
+                self._search_cache.clear()
                 break
+            self.perform_search(search_type)
 
     def handle_job_management(self):
         """Handle job management operations"""
         self.current_context = "job"
 
         while True:
-            action = self.get_quick_action("job")
-
-            if action in ["c", "create"]:
-                interval = IntPrompt.ask(
-                    "⏱️ [bold]Job interval (minutes)[/bold]", default=60
-                )
-                if Confirm.ask("Create periodic paper insertion job?", default=True):
-                    self.job_manager.create_insertion_job(interval)
+            handler = self._job_actions.get(self.get_quick_action("job"))
+            if handler is None:
+                break
+            handler()
 
-            elif action in ["d", "delete"]:
-                if Confirm.ask("Delete periodic paper insertion job?", default=False):
-                    self.job_manager.delete_job()
+    def create_job(self):
+        """Create the periodic paper insertion job"""
+        interval = IntPrompt.ask("⏱️ [bold]Job interval (minutes)[/bold]", default=60)
+        if Confirm.ask("Create periodic paper insertion job?", default=True):
+            self.job_manager.create_insertion_job(interval)
 
-            elif action in ["s", "status"]:
-                self.job_manager.display_job_status()
+    def delete_job(self):
+        """Delete the periodic paper insertion job"""
+        if Confirm.ask("Delete periodic paper insertion job?", default=False):
+            self.job_manager.delete_job()
 
-            elif action in ["b", "back"]:
-                break
+    def show_job_status(self):
+        """Show the status of the periodic paper insertion job"""
+        self.job_manager.display_job_status()
 
     def handle_ai_features(self):
         """Handle AI-related features"""
         self.current_context = "ai"
 
         while True:
-            action = self.get_quick_action("ai")
-
-            if action in ["s", "summary"]:
-                self.view_paper_summary()
-            elif action in ["g", "generate"]:
-                self.generate_summary_for_paper()
-            elif action in ["b", "back"]:
+            handler = self._ai_actions.get(self.get_quick_action("ai"))
+            if handler is None:
                 break
+            handler()
 
     def handle_agent_features(self):
         """Handle agent-related features"""
         self.current_context = "agent"
 
         while True:
-            action = self.get_quick_action("agent")
-
-            if action in ["c", "chat"]:
-                self.chat_with_agent()
-            elif action in ["l", "list"]:
-                self.list_agents()
-            elif action in ["d", "delete"]:
-                self.delete_agent()
-            elif action in ["r", "recreate"]:
-                self.recreate_agent()
-            elif action in ["b", "back"]:
+            handler = self._agent_actions.get(self.get_quick_action("agent"))
+            if handler is None:
                 break
+            handler()
 
     def chat_with_agent(self):
         """Interactive chat with the research papers agent"""
@@ -592,12 +1072,21 @@ class ScholarMapCLI:
             except Exception as e:
                 self.console.print(f"[red]Error: {str(e)}[/red]")
 
+    def _agents(self):
+        """Return the agent list, reusing one fetched within AGENTS_CACHE_TTL"""
+        now = time.monotonic()
+        fetched_at, agents = self._agents_cache
+        if agents is None or now - fetched_at >= AGENTS_CACHE_TTL:
+            agents = self.manager.list_agents()
+            self._agents_cache = (now, agents)
+        return agents
+
     def list_agents(self):
         """List all available agents"""
         self.console.print("\n[bold cyan]📋 Available Agents[/bold cyan]")
 
         try:
-            agents = self.manager.list_agents()
+            agents = self._agents()
 
             if not agents:
                 self.console.print("[yellow]No agents found.[/yellow]")
@@ -625,7 +1114,7 @@ class ScholarMapCLI:
         self.console.print("\n[bold cyan]🗑️ Delete Agent[/bold cyan]")
 
         try:
-            agents = self.manager.list_agents()
+            agents = self._agents()
 
             if not agents:
                 self.console.print("[yellow]No agents found to delete.[/yellow]")
@@ -648,6 +1137,8 @@ class ScholarMapCLI:
 
                 if Confirm.ask(f"Delete agent '{agent_name}'?", default=False):
                     success = self.manager.delete_agent(agent_name)
+                    self._agents_cache = (0.0, None)
+                    self.manager.answer_cache.clear()
                     if success:
                         self.console.print(
                             f"[bold green]✅ Agent '{agent_name}' deleted successfully![/bold green]"
@@ -676,6 +1167,9 @@ class ScholarMapCLI:
 
                 # Create new agent
                 success = self.manager.create_research_agent()
+                self._agents_cache = (0.0, None)
+                # Answers from the previous agent no longer apply
+                self.manager.answer_cache.clear()
                 if success:
                     self.console.print(
                         "[bold green]✅ Research papers agent recreated successfully![/bold green]"
@@ -707,8 +1201,6 @@ class ScholarMapCLI:
                         "[yellow]❌ No papers found for the search query.[/yellow]"
                     )
                     return
-                # Convert DataFrame to list of dicts for processing
-                results = results.to_dict("records")
             elif not results:
                 # It's a list or other iterable
                 self.console.print(
@@ -717,59 +1209,46 @@ class ScholarMapCLI:
                 return
 
             # Debug: Show the structure of the first result
-            if results:
-                self.console.print(
-                    f"[dim]Debug: First result keys: {list(results[0].keys())}[/dim]"
+            if DEBUG:
+                first = (
+                    results.iloc[0].to_dict()
+                    if hasattr(results, "iloc")
+                    else results[0]
                 )
                 self.console.print(
-                    f"[dim]Debug: First result structure: {results[0]}[/dim]"
+                    f"[dim]Debug: First result keys: {list(first.keys())}[/dim]"
                 )
+                self.console.print(f"[dim]Debug: First result structure: {first}[/dim]")
 
-            # Display search results for selection
-            self.console.print(f"\n[bold]Found {len(results)} papers:[/bold]")
-            for i, result in enumerate(results, 1):
-                metadata = result.get("metadata", {})
-                if isinstance(metadata, str):
-                    try:
-                        metadata = json.loads(metadata)
-                    except:
-                        metadata = {}
-
-                title = metadata.get("title", "N/A")
-                authors = metadata.get("authors", "N/A")
-
-                # Try to get paper_id from different possible locations
-                paper_id = (
-                    result.get("paper_id", "")
-                    or result.get("id", "")
-                    or metadata.get("paper_id", "")
-                )
+            # Parse each row's metadata once for both the listing and the
+            # selection below
+            metadata, paper_ids = _result_columns(results)
 
-                self.console.print(f"{i}. [bold]{title}[/bold]")
-                self.console.print(f"   👥 {authors}")
-                self.console.print(f"   🆔 {paper_id}")
-                self.console.print()
+            # Display search results for selection in one table render
+            table = Table(
+                title=f"Found {len(results)} papers",
+                show_header=True,
+                header_style="bold magenta",
+            )
+            table.add_column("#", style="bold blue", justify="right")
+            table.add_column("Title", style="bold")
+            table.add_column("Authors", style="cyan")
+            table.add_column("Paper ID", style="dim")
+            for i, (meta, paper_id) in enumerate(zip(metadata, paper_ids), 1):
+                table.add_row(
+                    str(i),
+                    Text(str(meta.get("title", "N/A"))),
+                    Text(str(meta.get("authors", "N/A"))),
+                    Text(str(paper_id)),
+                )
+            self.console.print(table)
 
             # Let user select a paper
             choice = IntPrompt.ask(
                 "📋 [bold]Select paper ID (not number!)[/bold]", default=1
             )
             if 1 <= choice <= len(results):
-                selected_paper = results[choice - 1]
-
-                # Try to get paper_id from different possible locations
-                metadata = selected_paper.get("metadata", {})
-                if isinstance(metadata, str):
-                    try:
-                        metadata = json.loads(metadata)
-                    except:
-                        metadata = {}
-
-                paper_id = (
-                    selected_paper.get("paper_id", "")
-                    or selected_paper.get("id", "")
-                    or metadata.get("paper_id", "")
-                )
+                paper_id = paper_ids[choice - 1]
 
                 if paper_id:
                     self.manager.display_paper_summary(paper_id)
@@ -790,20 +1269,7 @@ class ScholarMapCLI:
         authors = Prompt.ask("👥 [bold]Authors[/bold]")
         research_field = Prompt.ask("🔍 [bold]Research field[/bold]")
 
-        self.console.print(
-            "\n📝 [bold]Abstract[/bold] [dim](Enter text, then press Enter twice when done)[/dim]"
-        )
-        abstract_lines = []
-        while True:
-            line = input()
-            if line.strip() == "":
-                if abstract_lines and abstract_lines[-1].strip() == "":
-                    break
-                abstract_lines.append(line)
-            else:
-                abstract_lines.append(line)
-
-        abstract = "\n".join(abstract_lines).strip()
+        abstract = self.read_abstract()
 
         if not abstract:
             self.console.print(
@@ -811,19 +1277,22 @@ class ScholarMapCLI:
             )
             return
 
+        from src.models.paper import Paper
+
         # Create a temporary paper object for summary generation
+        # Positional arguments in Paper field order
         temp_paper = Paper(
-            paper_id="temp",
-            title=title,
-            authors=authors,
-            category="temp",
-            pub_date="",
-            arxiv_id="",
-            journal="",
-            research_field=research_field,
-            paper_type="",
-            citation_count=0,
-            abstract=abstract,
+            "temp",
+            title,
+            authors,
+            "temp",
+            "",
+            "",
+            "",
+            research_field,
+            "",
+            0,
+            abstract,
         )
 
         try:
@@ -843,45 +1312,80 @@ class ScholarMapCLI:
         except Exception as e:
             self.console.print(f"[red]❌ Error generating summary: {str(e)}[/red]")
 
+    def load_demo_data(self):
+        """Insert the bundled sample papers"""
+        self.console.print("\n[bold cyan]🎯 Loading sample data...[/bold cyan]")
+        try:
+            from src.sample_data_manager import insert_sample_papers
+
+            insert_sample_papers(self.manager)
+        except Exception as e:
+            self.console.print(f"[red]❌ Error: {str(e)}[/red]")
+
     def handle_evaluate_knowledge_base(self):
         """Handle evaluation of the knowledge base via CLI"""
         self.console.print("\n[bold cyan]🧪 Evaluate Knowledge Base[/bold cyan]")
         try:
-            kb_name = Prompt.ask("Knowledge base name", default="research_papers_kb")
-            test_table = Prompt.ask("Test table (e.g. my_datasource.my_test_table)")
-            version = Prompt.ask("Version column or value", default="doc_id")
-            from_sql = Prompt.ask(
-                "SQL to generate data (from_sql)",
-                default="SELECT content FROM my_datasource.my_table",
-            )
-            count = IntPrompt.ask("Number of rows to generate (count)", default=100)
-            evaluate = Confirm.ask("Run evaluation (True/False)?", default=False)
-            llm_provider = Prompt.ask("LLM provider", default="openai")
-            llm_api_key = Prompt.ask(
-                "LLM API key",
-                default=os.environ.get("OPENAI_API_KEY", ""),
-            )
-            llm_model_name = Prompt.ask("LLM model name", default="gpt-4o")
-            save_to = Prompt.ask(
-                "Save results to table (e.g. my_datasource.my_result_table)"
-            )
+            if EVAL_CONFIG:
+                self.console.print(
+                    f"[dim]Using evaluation settings from {EVAL_CONFIG}[/dim]"
+                )
+                config = _load_eval_config(EVAL_CONFIG)
+            else:
+                config = self._ask_eval_config()
 
             result = self.manager.evaluate_knowledge_base(
-                kb_name=kb_name,
-                test_table=test_table,
-                version=version,
-                generate_data={"from_sql": from_sql, "count": count},
-                evaluate=evaluate,
-                llm_provider=llm_provider,
-                llm_api_key=llm_api_key,
-                llm_model_name=llm_model_name,
-                save_to=save_to,
+                kb_name=config["kb_name"],
+                test_table=config["test_table"],
+                version=config["version"],
+                generate_data={
+                    "from_sql": config["from_sql"],
+                    "count": config["count"],
+                },
+                evaluate=config["evaluate"],
+                llm_provider=config["llm_provider"],
+                llm_api_key=config["llm_api_key"],
+                llm_model_name=config["llm_model_name"],
+                save_to=config["save_to"],
             )
             self.console.print("[bold green]Evaluation results:[/bold green]")
             self.console.print(result)
         except Exception as e:
             self.console.print(f"[red]Error during evaluation: {str(e)}[/red]")
 
+    def _ask_eval_config(self) -> dict:
+        """Prompt for each knowledge base evaluation setting"""
+        defaults = _EVAL_DEFAULTS
+        return {
+            "kb_name": Prompt.ask("Knowledge base name", default=defaults["kb_name"]),
+            "test_table": Prompt.ask("Test table (e.g. my_datasource.my_test_table)"),
+            "version": Prompt.ask(
+                "Version column or value", default=defaults["version"]
+            ),
+            "from_sql": Prompt.ask(
+                "SQL to generate data (from_sql)", default=defaults["from_sql"]
+            ),
+            "count": IntPrompt.ask(
+                "Number of rows to generate (count)", default=defaults["count"]
+            ),
+            "evaluate": Confirm.ask(
+                "Run evaluation (True/False)?", default=defaults["evaluate"]
+            ),
+            "llm_provider": Prompt.ask(
+                "LLM provider", default=defaults["llm_provider"]
+            ),
+            "llm_api_key": Prompt.ask(
+                "LLM API key",
+                default=os.environ.get("OPENAI_API_KEY", ""),
+            ),
+            "llm_model_name": Prompt.ask(
+                "LLM model name", default=defaults["llm_model_name"]
+            ),
+            "save_to": Prompt.ask(
+                "Save results to table (e.g. my_datasource.my_result_table)"
+            ),
+        }
+
     def run(self):
         """Main application loop with improved UX"""
         try:
@@ -890,48 +1394,71 @@ class ScholarMapCLI:
             self.show_header()
 
             self.show_status("Connecting to MindsDB...")
+            from src.mindsdb_manager import MindsDBManager
+            from src.job_manager import JobManager
+
+            self.manager = MindsDBManager()
             if self.manager.connect() is False:
                 return
+            self.job_manager = JobManager(self.manager)
 
             self.show_status("✅ Connected successfully")
+            if AUTO_INSERT:
+                from src.insertion_firehose import InsertionFirehose
+
+                self.firehose = InsertionFirehose(self._insert_quietly)
+            self.resume_queued_papers()
 
             # Main application loop
             while True:
+                # An insert left running in the background may finish while
+                # the user is in another menu
+                if self._pending_insert is not None and self._pending_insert[0].done():
+                    self._finish_insert()
                 action = self.get_quick_action("main")
-
-                if action in ["i", "insert"]:
-                    self.handle_insert_papers()
-                elif action in ["s", "search"]:
-                    self.handle_search_papers()
-                elif action in ["a", "ai"]:
-                    self.handle_ai_features()
-                elif action in ["ag", "agent"]:
-                    self.handle_agent_features()
-                elif action in ["d", "demo"]:
-                    self.console.print(
-                        "\n[bold cyan]🎯 Loading sample data...[/bold cyan]"
-                    )
-                    try:
-                        insert_sample_papers(self.manager)
-                    except Exception as e:
-                        self.console.print(f"[red]❌ Error: {str(e)}[/red]")
-                elif action in ["j", "job"]:
-                    self.handle_job_management()
-                elif action in ["eval", "evaluate"]:
-                    self.handle_evaluate_knowledge_base()
-                elif action in ["q", "quit"]:
+                handler = self._main_actions.get(action)
+                if handler is None:
+                    if action not in ("q", "quit"):
+                        # Empty input returns the prompt's "b" default, which
+                        # means nothing at the top level; ask again
+                        continue
+                    self._wait_for_pending_insert()
+                    if self.firehose is not None:
+                        self.firehose.close()
+                        self._apply_auto_inserts()
                     self.console.print(
                         "\n[bold green]👋 Thank you for using Scholar Map![bold green]"
                     )
                     break
+                handler()
 
         except KeyboardInterrupt:
             self.console.print("\n\n[yellow]👋 Application interrupted[/yellow]")
+            # The worker thread finishes the insert regardless; wait so the
+            # papers it stored are not offered for resume next session
+            self._wait_for_pending_insert()
             self.console.print(
                 "[bold green]Thank you for using Scholar Map![/bold green]"
             )
 
 
 if __name__ == "__main__":
-    app = ScholarMapCLI()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Scholar Map CLI")
+    parser.add_argument(
+        "--batch-size",
+        "-b",
+        type=int,
+        help="Maximum papers per insert request (default: $SCHOLAR_MAP_BATCH_SIZE or 1000)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        "-c",
+        type=int,
+        help="Maximum concurrent INSERT batches (default: $SCHOLAR_MAP_INSERT_CONCURRENCY or 2)",
+    )
+    args = parser.parse_args()
+
+    app = ScholarMapCLI(batch_size=args.batch_size, concurrency=args.concurrency)
     app.run()
@@ -15,17 +15,13 @@ import os
 # Add src directory to Python path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
 
-from src.sample_data_manager import insert_sample_papers
-from src.mindsdb_manager import MindsDBManager
-from rich.console import Console
+from src.console import console
 from rich.panel import Panel
 from rich.text import Text
 
 
 def main():
     """Main function to run sample data insertion"""
-    console = Console()
-
     # Display header
     header_text = Text("Scholar Map - Sample Data Installer", style="bold blue")
     header_panel = Panel(
@@ -36,6 +32,10 @@ def main():
     )
     console.print(header_panel)
 
+    # Imported after the header so the MindsDB SDK load does not delay it
+    from src.sample_data_manager import insert_sample_papers
+    from src.mindsdb_manager import MindsDBManager
+
     # Initialize manager
     manager = MindsDBManager()
 
@@ -0,0 +1,7 @@
+"""Shared Rich console for all Scholar Map output"""
+
+from rich.console import Console
+
+# One console means the terminal size and color support are probed once and
+# every module writes through the same output stream
+console = Console()
@@ -0,0 +1,22 @@
+"""Text formatting helpers shared by the CLI and the MindsDB manager"""
+
+from functools import lru_cache
+
+# 150 characters of abstract plus the ellipsis
+ABSTRACT_PREVIEW_WIDTH = 153
+
+
+def truncate(text: str, width: int) -> str:
+    """Clip text to at most width characters, ending in "..." when it is cut"""
+    return text if len(text) <= width else text[: width - 3] + "..."
+
+
+@lru_cache(maxsize=1024)
+def abstract_preview(abstract: str) -> str:
+    """
+    Short preview of an abstract for review listings.
+
+    Cached because the same queued abstracts are previewed on every review;
+    str objects cache their own hash, so a repeat lookup costs no rescan.
+    """
+    return truncate(abstract, ABSTRACT_PREVIEW_WIDTH)
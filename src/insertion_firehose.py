@@ -0,0 +1,98 @@
+"""Background batching of queued papers into bulk inserts"""
+
+import queue
+import threading
+import time
+from typing import Callable, List, Tuple
+
+from src.models.paper import Paper
+
+# Sentinels understood by the worker thread
+_FLUSH = object()
+_STOP = object()
+
+
+class InsertionFirehose:
+    """
+    Coalesce papers submitted one at a time into batched inserts.
+
+    A worker thread collects submitted papers and hands them to `insert` once
+    `max_batch` papers are buffered or `max_wait` seconds have passed since
+    the first one arrived. Finished batches are reported on `completed` as
+    (papers, failed indices) pairs for the caller to apply.
+
+    Args:
+        insert: Callable inserting a list of papers and returning the
+            indices of the ones that failed
+        max_batch: Maximum number of papers per insert
+        max_wait: Seconds to wait for more papers before inserting
+    """
+
+    def __init__(
+        self,
+        insert: Callable[[List[Paper]], List[int]],
+        max_batch: int = 64,
+        max_wait: float = 2.0,
+    ):
+        self.insert = insert
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.completed: "queue.Queue[Tuple[List[Paper], List[int]]]" = queue.Queue()
+        self._queue: queue.Queue = queue.Queue()
+        self._worker = threading.Thread(
+            target=self._run, name="insertion-firehose", daemon=True
+        )
+        self._worker.start()
+
+    def submit(self, paper: Paper):
+        """Queue a paper for the next batch and return immediately"""
+        self._queue.put(paper)
+
+    def flush(self):
+        """Insert everything submitted so far and wait until it is done"""
+        self._queue.put(_FLUSH)
+        self._queue.join()
+
+    def close(self):
+        """Flush outstanding papers and stop the worker thread"""
+        self._queue.put(_STOP)
+        self._worker.join()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _FLUSH:
+                self._queue.task_done()
+                continue
+            if item is _STOP:
+                self._queue.task_done()
+                return
+
+            batch = [item]
+            sentinel = None
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is _FLUSH or item is _STOP:
+                    sentinel = item
+                    break
+                batch.append(item)
+
+            self._insert(batch)
+            for _ in range(len(batch) + (sentinel is not None)):
+                self._queue.task_done()
+            if sentinel is _STOP:
+                return
+
+    def _insert(self, batch: List[Paper]):
+        try:
+            failed = self.insert(batch)
+        except Exception:
+            failed = list(range(len(batch)))
+        self.completed.put((batch, failed))
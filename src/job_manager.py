@@ -1,16 +1,11 @@
 """Job Manager for MindsDB"""
 
 import os
-from datetime import datetime, timedelta
 from typing import Optional
-from rich.console import Console
 from rich.panel import Panel
-from faker import Faker
+from src.console import console
+from src.mindsdb_manager import sql_literal
 from src.models.paper import Paper
-import uuid
-
-console = Console()
-fake = Faker()
 
 
 class JobManager:
@@ -19,7 +14,7 @@ class JobManager:
     def __init__(self, mindsdb_manager):
         self.mindsdb_manager = mindsdb_manager
         self.job_name = "periodic_paper_insertion"
-        self.project = None
+        self.project = mindsdb_manager.project
 
     def create_insertion_job(self, interval_minutes: int = 60) -> bool:
         """
@@ -28,36 +23,42 @@ class JobManager:
         Args:
             interval_minutes: Interval in minutes between job executions
         """
-        try:
-            self.project = self.mindsdb_manager.server.projects.mindsdb
+        # Faker loads its locale providers on import, so only pay for it when
+        # a job is actually created
+        from faker import Faker
+
+        fake = Faker()
 
-            # Create the job
+        try:
+            # MindsDB substitutes {{START_DATETIME}} and {{START_DATE}} on every
+            # run, so each run inserts a new paper instead of overwriting the
+            # same paper_id. The text columns are sample content fixed when the
+            # job is created; MindsDB's SQL layer documents no functions to
+            # vary them per run.
             job_query = f"""
             CREATE JOB IF NOT EXISTS mindsdb.{self.job_name} AS (
                 INSERT INTO research_papers_kb 
                 (paper_id, title, authors, category, pub_date, arxiv_id, journal, 
                 research_field, paper_type, citation_count, abstract, summary)
                 VALUES (
-                    '{uuid.uuid4()}' as paper_id,
-                    '{fake.sentence()}' as title,
-                    '{fake.name()}' as authors,
+                    CONCAT('job-', '{{{{START_DATETIME}}}}') as paper_id,
+                    {sql_literal(fake.sentence())} as title,
+                    {sql_literal(fake.name())} as authors,
                     'cs.AI' as category,
-                    '{datetime.now().strftime('%Y-%m-%d')}' as pub_date,
-                    CONCAT('arxiv:', '{uuid.uuid4()}') as arxiv_id,
-                    '{fake.company()}' as journal,
+                    '{{{{START_DATE}}}}' as pub_date,
+                    CONCAT('arxiv:', '{{{{START_DATETIME}}}}') as arxiv_id,
+                    {sql_literal(fake.company())} as journal,
                     'Machine Learning' as research_field,
                     'Research Paper' as paper_type,
-                    '{fake.random_int(min=0, max=100)}' as citation_count,
-                    '{fake.text(max_nb_chars=500)}' as abstract,
+                    {sql_literal(fake.random_int(min=0, max=100))} as citation_count,
+                    {sql_literal(fake.text(max_nb_chars=500))} as abstract,
                     'AI-generated summary of the research paper' as summary
                 )
             )
             EVERY {interval_minutes} minutes;
             """
 
-            query = self.project.query(job_query)
-            result = query.fetch()
-            print(result)
+            self.project.query(job_query).fetch()
 
             console.print(
                 Panel(
@@ -83,9 +84,6 @@ class JobManager:
     def delete_job(self) -> bool:
         """Delete the periodic paper insertion job"""
         try:
-            if not self.project:
-                self.project = self.mindsdb_manager.server.projects.mindsdb
-
             delete_query = f"DROP JOB mindsdb.{self.job_name};"
             query = self.project.query(delete_query)
             query.fetch()
@@ -113,17 +111,13 @@ class JobManager:
     def get_job_status(self) -> Optional[dict]:
         """Get the status of the periodic paper insertion job"""
         try:
-            if not self.project:
-                self.project = self.mindsdb_manager.server.projects.mindsdb
-
             # First try to get from jobs table
             status_query = f"""
             SELECT * FROM mindsdb.jobs 
             WHERE name = '{self.job_name}';
             """
 
-            result = self.project.query(status_query)
-            jobs = result.fetch()
+            jobs = self.project.query(status_query).fetch()
 
             if not jobs.empty:
                 return jobs.iloc[0].to_dict()
@@ -134,8 +128,7 @@ class JobManager:
             WHERE project = 'mindsdb' AND name = '{self.job_name}';
             """
 
-            result = self.project.query(history_query)
-            history = result.fetch()
+            history = self.project.query(history_query).fetch()
 
             if not history.empty:
                 return history.iloc[0].to_dict()
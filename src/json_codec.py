@@ -0,0 +1,30 @@
+"""JSON encoding helpers, using orjson when it is installed"""
+
+import json
+from typing import Any, Dict
+
+try:
+    import orjson
+
+    dumps = orjson.dumps
+    loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the standard library
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to UTF-8 encoded JSON bytes"""
+        return json.dumps(obj).encode()
+
+    loads = json.loads
+
+
+def parse_metadata(metadata: Any) -> Dict[str, Any]:
+    """Return knowledge base row metadata as a dict, parsing JSON strings"""
+    if isinstance(metadata, dict):
+        return metadata
+    if not metadata:
+        return {}
+    try:
+        parsed = loads(metadata)
+    except (TypeError, ValueError):
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
@@ -1,19 +1,148 @@
 """MindsDB Manager"""
 
+import asyncio
+import atexit
 import os
-from typing import List, Optional, Dict, Any, Union
+from operator import attrgetter
+from typing import AbstractSet, List, Optional, Dict, Any, Union
 import mindsdb_sdk
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.console import Group
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from src.console import console
+from src.formatting import truncate
+from src.json_codec import parse_metadata
 from src.models.paper import Paper
+from src.response_cache import ResponseCache, normalize_text
 
 load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+BATCH_SIZE = int(os.getenv("SCHOLAR_MAP_BATCH_SIZE", "1000"))
+INSERT_CONCURRENCY = int(os.getenv("SCHOLAR_MAP_INSERT_CONCURRENCY", "2"))
+# Keep-alive connections kept per host; covers concurrent inserts and
+# summary requests, which otherwise overflow requests' default pool of 10
+HTTP_POOL_SIZE = max(16, 2 * INSERT_CONCURRENCY)
+# Upper bound on the size of one insert request, whether sent as JSON rows
+# or as an INSERT statement
+MAX_STATEMENT_BYTES = 4 * 1024 * 1024
+
+PAPER_COLUMNS = (
+    "paper_id",
+    "title",
+    "authors",
+    "category",
+    "pub_date",
+    "arxiv_id",
+    "journal",
+    "research_field",
+    "paper_type",
+    "citation_count",
+    "abstract",
+    "summary",
+)
+
+# Knowledge base definition; the OpenAI API key is filled in only when the
+# knowledge base is created, so it is never stored in a module global
+_KB_CREATE_SQL = """
+    CREATE KNOWLEDGE_BASE research_papers_kb
+    USING
+        embedding_model = {{
+            "provider": "openai",
+            "model_name": "text-embedding-3-large",
+            "api_key": "{api_key}"
+        }},
+        reranking_model = {{
+            "provider": "openai",
+            "model_name": "gpt-4o",
+            "api_key": "{api_key}"
+        }},
+        metadata_columns = [
+            'paper_id',
+            'title', 
+            'authors', 
+            'category', 
+            'pub_date', 
+            'arxiv_id', 
+            'journal',
+            'research_field',
+            'paper_type',
+            'citation_count',
+            'summary'
+        ],
+        content_columns = ['abstract', 'full_text'],
+        id_column = 'paper_id';
+"""
+
+# (label, metadata key) pairs shown in the paper details view
+_PAPER_DETAIL_FIELDS = (
+    ("Title", "title"),
+    ("Authors", "authors"),
+    ("Category", "category"),
+    ("Research Field", "research_field"),
+    ("Publication Date", "pub_date"),
+    ("Journal", "journal"),
+    ("Citation Count", "citation_count"),
+)
+
+# Pulls every column of a paper out as one tuple in a single C-level call
+_paper_values = attrgetter(*PAPER_COLUMNS)
+
+
+def sql_literal(value: Any) -> str:
+    """Render a Python value as a SQL literal"""
+    if isinstance(value, int):
+        return str(value)
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def build_insert_query(papers: List[Paper], table: str = "research_papers_kb") -> str:
+    """Build a single multi-row INSERT statement for a batch of papers"""
+    rows = ",\n".join(
+        "(" + ", ".join(map(sql_literal, values)) + ")"
+        for values in map(_paper_values, papers)
+    )
+    return f"INSERT INTO {table}\n({', '.join(PAPER_COLUMNS)})\nVALUES\n{rows}"
+
+
+def _split_batches(
+    papers: List[Paper], batch_size: int, max_bytes: int = MAX_STATEMENT_BYTES
+) -> List[tuple[int, List[Paper]]]:
+    """
+    Split papers into (offset, batch) pairs for insertion.
 
-console = Console()
+    A batch holds at most batch_size papers, and is closed early once
+    another row would take its request past max_bytes.
+    """
+    batches = []
+    start = size = 0
+    for index, values in enumerate(map(_paper_values, papers)):
+        # Quotes, separators and parentheses add a few bytes per value
+        row_size = sum(len(str(value).encode()) + 4 for value in values)
+        if index > start and (
+            index - start >= batch_size or size + row_size > max_bytes
+        ):
+            batches.append((start, papers[start:index]))
+            start, size = index, 0
+        size += row_size
+    if start < len(papers):
+        batches.append((start, papers[start:]))
+    return batches
+
+
+def _server_rejected(error: Exception) -> bool:
+    """Whether the server refused the request's data, rather than failing itself"""
+    # SQL errors surface as RuntimeError; the knowledge base endpoint raises
+    # requests.HTTPError carrying the response. Only a 4xx other than a rate
+    # limit points at the rows; 5xx and 429 mean the server is struggling
+    # and retrying row by row would only add load
+    if isinstance(error, RuntimeError):
+        return True
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    return status is not None and 400 <= status < 500 and status != 429
 
 
 class MindsDBManager:
@@ -31,14 +160,26 @@ class MindsDBManager:
         self.connection_url = connection_url or "http://127.0.0.1:47334"
         self.research_papers_kb = None
         self.server = None
+        self.project = None
+        # Agent answers and generated summaries for repeated prompts
+        self.answer_cache = ResponseCache()
+        self.summary_cache = ResponseCache()
 
     def connect(self):
         """Connect to MindsDB server"""
         try:
             console.print("[dim]Attempting to connect to MindsDB server...[/dim]")
+            # Every query goes through the server's one requests.Session, so
+            # its pooled keep-alive connections are reused until disconnect()
             self.server = mindsdb_sdk.connect(self.connection_url)
+            self._configure_session()
+            atexit.register(self.disconnect)
+            # Looking a project up lists all projects on the server, so do it
+            # once and reuse the handle for every query
+            self.project = self.server.projects.mindsdb
 
             try:
+                # A single metadata GET for the knowledge base
                 self.research_papers_kb = self.server.knowledge_bases.research_papers_kb
                 console.print(
                     "[bold green]Connection established successfully![/bold green]"
@@ -46,7 +187,11 @@ class MindsDBManager:
                 console.print(
                     "[dim]Research papers knowledge base is ready for use.[/dim]"
                 )
-            except Exception:
+            except OSError as e:
+                # Only an HTTP error response means the knowledge base is
+                # missing; a transport failure means the server is unreachable
+                if getattr(e, "response", None) is None:
+                    raise
                 console.print(
                     "[bold green]Connection established successfully![/bold green]"
                 )
@@ -74,6 +219,34 @@ class MindsDBManager:
             console.print(error_panel)
             return False
 
+    def _configure_session(self):
+        """Size the SDK session's connection pool and retry failed connects"""
+        # Failed connects are retried for every method. Read errors are only
+        # retried for the methods in allowed_methods, which leaves out POST
+        # (SQL queries) and PUT (knowledge base inserts), so a request the
+        # server may already be processing is never sent twice
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                allowed_methods=Retry.DEFAULT_ALLOWED_METHODS - {"PUT"},
+            ),
+        )
+        session = self.server.api.session
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+    def disconnect(self):
+        """Close the pooled HTTP connections to the MindsDB server"""
+        if self.server is not None:
+            self.server.api.session.close()
+            self.server = None
+            self.project = None
+            self.research_papers_kb = None
+        atexit.unregister(self.disconnect)
+
     def create_research_papers_kb(self):
         """Create research papers knowledge base"""
 
@@ -110,38 +283,9 @@ class MindsDBManager:
             # query = project.query(db_query)
             # query.fetch()
 
-            kb_query = f"""
-            CREATE KNOWLEDGE_BASE research_papers_kb
-            USING
-                embedding_model = {{
-                    "provider": "openai",
-                    "model_name": "text-embedding-3-large",
-                    "api_key": "{OPENAI_API_KEY}"
-                }},
-                reranking_model = {{
-                    "provider": "openai",
-                    "model_name": "gpt-4o",
-                    "api_key": "{OPENAI_API_KEY}"
-                }},
-                metadata_columns = [
-                    'paper_id',
-                    'title', 
-                    'authors', 
-                    'category', 
-                    'pub_date', 
-                    'arxiv_id', 
-                    'journal',
-                    'research_field',
-                    'paper_type',
-                    'citation_count',
-                    'summary'
-                ],
-                content_columns = ['abstract', 'full_text'],
-                id_column = 'paper_id';
-            """
+            kb_query = _KB_CREATE_SQL.format(api_key=OPENAI_API_KEY)
 
-            project = self.server.projects.mindsdb
-            query = project.query(kb_query)
+            query = self.project.query(kb_query)
             query.fetch()
             self.research_papers_kb = self.server.knowledge_bases.research_papers_kb
             console.print(
@@ -193,8 +337,7 @@ class MindsDBManager:
                 openai_api_key = '{OPENAI_API_KEY}';
             """
 
-            project = self.server.projects.mindsdb
-            query = project.query(engine_query)
+            query = self.project.query(engine_query)
             query.fetch()
 
             summary_model_query = f"""
@@ -213,8 +356,7 @@ class MindsDBManager:
                 Summary:';
             """
 
-            project = self.server.projects.mindsdb
-            query = project.query(summary_model_query)
+            query = self.project.query(summary_model_query)
             query.fetch()
 
             console.print(
@@ -271,8 +413,7 @@ class MindsDBManager:
                 ';
             """
 
-            project = self.server.projects.mindsdb
-            query = project.query(agent_query)
+            query = self.project.query(agent_query)
             query.fetch()
 
             console.print(
@@ -292,18 +433,26 @@ class MindsDBManager:
 
     def query_agent(self, question: str) -> str:
         """Query the research papers agent with a question"""
+        cache_key = normalize_text(question)
+        cached = self.answer_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             agent_query = f"""
             SELECT answer
             FROM research_papers_agent
-            WHERE question = '{question.replace("'", "''")}';
+            WHERE question = {sql_literal(question)};
             """
 
             result = self.server.query(agent_query)
             results = result.fetch()
 
-            if results and len(results) > 0:
-                return results[0].get("answer", "")
+            if results is not None and not results.empty:
+                answer = results.iloc[0]["answer"] or ""
+                if answer:
+                    self.answer_cache.put(cache_key, answer)
+                return answer
             else:
                 return "I couldn't find an answer to your question. Please try rephrasing it."
 
@@ -342,85 +491,323 @@ class MindsDBManager:
             console.print(f"[red]Error deleting agent: {str(e)}[/red]")
             return False
 
-    def generate_paper_summary(self, paper: Paper) -> str:
-        """Generate AI summary for a research paper"""
+    def generate_paper_summary(self, paper: Paper, quiet: bool = False) -> str:
+        """Generate AI summary for a research paper, printing no warning if quiet"""
+        cache_key = (
+            normalize_text(paper.abstract),
+            normalize_text(paper.title),
+            normalize_text(paper.authors),
+            normalize_text(paper.research_field),
+        )
+        cached = self.summary_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             summary_query = f"""
             SELECT summary
             FROM paper_summarizer_model
-            WHERE abstract = '{paper.abstract.replace("'", "''")}'
-            AND title = '{paper.title.replace("'", "''")}'
-            AND authors = '{paper.authors.replace("'", "''")}'
-            AND research_field = '{paper.research_field.replace("'", "''")}';
+            WHERE abstract = {sql_literal(paper.abstract)}
+            AND title = {sql_literal(paper.title)}
+            AND authors = {sql_literal(paper.authors)}
+            AND research_field = {sql_literal(paper.research_field)};
             """
 
             result = self.server.query(summary_query)
             results = result.fetch()
 
-            if results and len(results) > 0:
-                return results[0].get("summary", "")
+            if results is not None and not results.empty:
+                summary = results.iloc[0]["summary"] or ""
+                if summary:
+                    self.summary_cache.put(cache_key, summary)
+                return summary
             else:
                 return ""
 
         except Exception as e:
-            console.print(
-                f"[yellow]Warning: Could not generate summary for '{paper.title}': {str(e)}[/yellow]"
-            )
+            if not quiet:
+                console.print(
+                    f"[yellow]Warning: Could not generate summary for '{paper.title}': {str(e)}[/yellow]"
+                )
             return ""
 
-    def insert_papers(self, papers: List[Paper]):
-        """Insert papers into the knowledge base"""
-        if not papers:
-            console.print("[yellow]No papers provided for insertion.[/yellow]")
-            return False
+    def existing_paper_ids(self, paper_ids: List[str]) -> set:
+        """Return which of the given paper IDs are already in the knowledge base"""
+        existing = set()
+
+        def lookup(literals: List[str]):
+            rows = self.server.query(
+                "SELECT id FROM research_papers_kb "
+                f"WHERE paper_id IN ({', '.join(literals)})"
+            ).fetch()
+            if "id" in rows.columns:
+                existing.update(rows["id"])
+
+        # Split the IN list so no lookup exceeds MAX_STATEMENT_BYTES
+        literals: List[str] = []
+        size = 0
+        for literal in map(sql_literal, paper_ids):
+            literal_size = len(literal.encode()) + 2
+            if literals and size + literal_size > MAX_STATEMENT_BYTES:
+                lookup(literals)
+                literals, size = [], 0
+            literals.append(literal)
+            size += literal_size
+        if literals:
+            lookup(literals)
+        return existing
+
+    def insert_batch(self, batch: List[Paper]):
+        """
+        Insert a batch of papers in one request.
 
-        try:
-            console.print(
-                f"[bold cyan]Preparing to insert {len(papers)} papers...[/bold cyan]"
+        Papers are sent as rows to the knowledge base insert endpoint, so the
+        server parses no SQL; a multi-row INSERT statement is only used when
+        no knowledge base handle is available.
+        """
+        if self.research_papers_kb is not None:
+            self.research_papers_kb.insert(
+                [
+                    dict(zip(PAPER_COLUMNS, values))
+                    for values in map(_paper_values, batch)
+                ]
             )
+        else:
+            self.server.query(build_insert_query(batch)).fetch()
 
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                task = progress.add_task(
-                    "Processing and inserting papers into knowledge base...",
-                    total=len(papers),
-                )
+    async def insert_batch_async(self, batch: List[Paper]):
+        """Run insert_batch in the default executor so batches can overlap"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.insert_batch, batch)
 
-                for paper in papers:
-                    # Generate AI summary for the paper
-                    if not paper.summary:
-                        progress.update(task, description="Generating AI summary...")
-                        paper.summary = self.generate_paper_summary(paper)
+    async def _insert_batches(
+        self,
+        batches: List[tuple[int, List[Paper]]],
+        concurrency: int,
+        progress=None,
+        task=None,
+        quiet: bool = False,
+    ) -> List[int]:
+        """
+        Insert batches with at most `concurrency` requests in flight.
+
+        When the server rejects a multi-row insert, its rows are retried
+        one at a time so a single bad row does not fail the whole batch.
+        Connection errors, server errors and rate limits fail the batch
+        without retrying.
+
+        Args:
+            batches: (offset, papers) pairs, where offset is the index of the
+                batch's first paper in the full insert list
+            quiet: Print nothing, leaving failures for the caller to report
 
-                    progress.update(
-                        task, description="Inserting paper into knowledge base..."
+        Returns:
+            Sorted indices of the papers that failed to insert
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        failed: List[int] = []
+
+        def report(message: str):
+            if not quiet:
+                console.print(message)
+
+        async def insert_rows(offset: int, batch: List[Paper]):
+            for index, paper in enumerate(batch, offset):
+                try:
+                    await self.insert_batch_async([paper])
+                except (
+                    RuntimeError,
+                    ConnectionError,
+                    TimeoutError,
+                    ValueError,
+                    OSError,
+                ) as e:
+                    report(
+                        f"[red]Paper '{paper.title}' failed to insert: {str(e)}[/red]"
                     )
+                    failed.append(index)
+
+        async def insert_one(offset: int, batch: List[Paper]):
+            async with semaphore:
+                try:
+                    await self.insert_batch_async(batch)
+                except (
+                    RuntimeError,
+                    ConnectionError,
+                    TimeoutError,
+                    ValueError,
+                    OSError,
+                ) as e:
+                    # A rejected insert may be down to one row
+                    if not _server_rejected(e):
+                        report(
+                            f"[red]Batch of {len(batch)} papers failed: {str(e)}[/red]"
+                        )
+                        failed.extend(range(offset, offset + len(batch)))
+                    elif len(batch) > 1:
+                        report(
+                            f"[yellow]Batch of {len(batch)} papers rejected, "
+                            f"retrying row by row: {str(e)}[/yellow]"
+                        )
+                        await insert_rows(offset, batch)
+                    else:
+                        report(f"[red]Paper failed to insert: {str(e)}[/red]")
+                        failed.append(offset)
+            if progress is not None:
+                progress.advance(task, len(batch))
+
+        await asyncio.gather(*(insert_one(offset, batch) for offset, batch in batches))
+        failed.sort()
+        return failed
+
+    async def insert_papers_async(
+        self,
+        papers: List[Paper],
+        batch_size: int = BATCH_SIZE,
+        concurrency: int = INSERT_CONCURRENCY,
+        progress=None,
+        task=None,
+        quiet: bool = False,
+        new_ids: AbstractSet[str] = frozenset(),
+    ) -> List[int]:
+        """
+        Generate missing summaries and insert papers concurrently.
+
+        Papers whose IDs are already in the knowledge base are skipped
+        first, so re-submitted papers cost no summary or embedding work.
+        IDs in `new_ids` are left out of that lookup, which is skipped
+        entirely when every paper is new.
+        Summaries are requested with up to `concurrency` model queries in
+        flight, then the papers are inserted in chunks of up to `batch_size`
+        (and at most MAX_STATEMENT_BYTES per request) with up to
+        `concurrency` insert requests in flight.
 
-                    insert_query = f"""
-                    INSERT INTO research_papers_kb 
-                    (paper_id, title, authors, category, pub_date, arxiv_id, journal, research_field, paper_type, citation_count, abstract, summary)
-                    VALUES (
-                        '{paper.paper_id}',
-                        '{paper.title.replace("'", "''")}',
-                        '{paper.authors.replace("'", "''")}',
-                        '{paper.category}',
-                        '{paper.pub_date}',
-                        '{paper.arxiv_id}',
-                        '{paper.journal.replace("'", "''")}',
-                        '{paper.research_field}',
-                        '{paper.paper_type}',
-                        {paper.citation_count},
-                        '{paper.abstract.replace("'", "''")}',
-                        '{paper.summary.replace("'", "''")}'
+        Args:
+            papers: Papers to insert
+            batch_size: Maximum number of rows per insert request
+            concurrency: Maximum number of concurrent requests
+            progress: Optional Progress to report on
+            task: Task ID within `progress`
+            quiet: Print nothing, leaving failures for the caller to report
+            new_ids: IDs known not to be stored yet, such as ones generated
+                this session and not sent before
+
+        Returns:
+            Indices into `papers` of the rows that failed to insert
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        existing = set()
+        lookup_ids = [
+            paper.paper_id for paper in papers if paper.paper_id not in new_ids
+        ]
+        if lookup_ids:
+            try:
+                existing = await loop.run_in_executor(
+                    None, self.existing_paper_ids, lookup_ids
+                )
+            except (RuntimeError, ConnectionError, TimeoutError, ValueError, OSError):
+                # The check is only an optimization; the knowledge base upserts
+                # on paper_id, so inserting everything is still correct
+                pass
+        # Indices into the caller's list of the papers still to insert
+        keep = range(len(papers))
+        if existing:
+            keep = [
+                i for i, paper in enumerate(papers) if paper.paper_id not in existing
+            ]
+            if progress is not None:
+                if not quiet:
+                    progress.console.print(
+                        f"[dim]Skipping {len(papers) - len(keep)} papers already "
+                        f"in the knowledge base[/dim]"
                     )
-                    """
+                progress.advance(task, len(papers) - len(keep))
+            papers = [papers[i] for i in keep]
+
+        async def summarize(paper: Paper):
+            async with semaphore:
+                paper.summary = await loop.run_in_executor(
+                    None, self.generate_paper_summary, paper, quiet
+                )
+
+        pending = [paper for paper in papers if not paper.summary]
+        if pending:
+            if progress is not None:
+                progress.update(task, description="Generating AI summaries...")
+            await asyncio.gather(*map(summarize, pending))
+
+        if progress is not None:
+            progress.update(task, description="Inserting papers into knowledge base...")
+        batches = _split_batches(papers, batch_size)
+        failed = await self._insert_batches(batches, concurrency, progress, task, quiet)
+        return [keep[i] for i in failed]
+
+    def insert_papers(
+        self,
+        papers: List[Paper],
+        batch_size: int = BATCH_SIZE,
+        concurrency: int = INSERT_CONCURRENCY,
+        quiet: bool = False,
+        new_ids: AbstractSet[str] = frozenset(),
+    ) -> List[int]:
+        """
+        Insert papers into the knowledge base.
 
-                    self.server.query(insert_query)
-                    progress.advance(task)
+        Synchronous wrapper around insert_papers_async that shows progress
+        and a result panel.
 
+        Args:
+            papers: Papers to insert
+            batch_size: Maximum number of rows per insert request
+            concurrency: Maximum number of concurrent INSERT requests
+            quiet: Print nothing at all, for background inserts that must not
+                draw over prompts; the caller reports failures
+            new_ids: IDs known not to be stored yet, which skip the
+                existing-ID lookup
+
+        Returns:
+            Indices into `papers` of the rows that failed to insert; an
+            empty list means every paper was inserted
+        """
+        if not papers:
+            if not quiet:
+                console.print("[yellow]No papers provided for insertion.[/yellow]")
+            return []
+
+        if quiet:
+            return asyncio.run(
+                self.insert_papers_async(
+                    papers, batch_size, concurrency, quiet=True, new_ids=new_ids
+                )
+            )
+
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
+        console.print(
+            f"[bold cyan]Preparing to insert {len(papers)} papers...[/bold cyan]"
+        )
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            refresh_per_second=4,
+            transient=True,
+        ) as progress:
+            task = progress.add_task(
+                "Processing and inserting papers into knowledge base...",
+                total=len(papers),
+            )
+
+            failed = asyncio.run(
+                self.insert_papers_async(
+                    papers, batch_size, concurrency, progress, task, new_ids=new_ids
+                )
+            )
+
+        if not failed:
             success_panel = Panel(
                 f"[bold green]Papers Inserted Successfully[/bold green]\n\n"
                 f"Successfully processed and inserted {len(papers)} research papers into the knowledge base.\n\n"
@@ -430,13 +817,10 @@ class MindsDBManager:
                 padding=(1, 2),
             )
             console.print(success_panel)
-            return True
-
-        except (ConnectionError, TimeoutError, ValueError, OSError) as e:
+        else:
             error_panel = Panel(
                 f"[bold red]Paper Insertion Failed[/bold red]\n\n"
-                f"An error occurred while inserting papers into the knowledge base.\n\n"
-                f"[dim]Error details: {str(e)}[/dim]\n\n"
+                f"{len(failed)} of {len(papers)} papers could not be inserted into the knowledge base.\n\n"
                 f"[yellow]Please verify:[/yellow]\n"
                 f"• Database connectivity\n"
                 f"• Paper data format\n"
@@ -446,13 +830,14 @@ class MindsDBManager:
                 padding=(1, 2),
             )
             console.print(error_panel)
-            return False
+        return failed
 
     def search_papers(
         self,
         query: str,
         relevance_threshold: Optional[float] = None,
         limit: int = 10,
+        quiet: bool = False,
         **filters,
     ) -> List[Dict[str, Any]]:
         """
@@ -462,6 +847,8 @@ class MindsDBManager:
             query: Natural language search query
             relevance_threshold: Minimum relevance score (0.0 to 1.0)
             limit: Maximum number of results to return
+            quiet: Return no results on error without printing it, for
+                searches run in the background
             **filters: Additional metadata filters (research_field, category, paper_type, etc.)
 
         Returns:
@@ -469,8 +856,7 @@ class MindsDBManager:
         """
         try:
             # Build the WHERE clause
-            escaped_query = query.replace("'", "''")
-            where_conditions = [f"content = '{escaped_query}' "]
+            where_conditions = [f"content = {sql_literal(query)}"]
 
             if relevance_threshold is not None:
                 where_conditions.append(f"relevance >= {relevance_threshold}")
@@ -486,8 +872,7 @@ class MindsDBManager:
                     "paper_type",
                     "journal",
                 ]:
-                    escaped_value = str(value).replace("'", "''")
-                    where_conditions.append(f"{key} = '{escaped_value}'")
+                    where_conditions.append(f"{key} = {sql_literal(str(value))}")
                 elif key == "citation_count":
                     where_conditions.append(f"citation_count >= {value}")
 
@@ -505,7 +890,8 @@ class MindsDBManager:
             return result.fetch()
 
         except Exception as e:
-            console.print(f"[red]Search error: {str(e)}[/red]")
+            if not quiet:
+                console.print(f"[red]Search error: {str(e)}[/red]")
             return []
 
     def search_by_research_field(
@@ -514,12 +900,14 @@ class MindsDBManager:
         field: str,
         relevance_threshold: Optional[float] = None,
         limit: int = 10,
+        quiet: bool = False,
     ) -> List[Dict[str, Any]]:
         """Search papers by specific research field"""
         return self.search_papers(
             query=query,
             relevance_threshold=relevance_threshold,
             limit=limit,
+            quiet=quiet,
             research_field=field,
         )
 
@@ -529,12 +917,14 @@ class MindsDBManager:
         category: str,
         relevance_threshold: Optional[float] = None,
         limit: int = 10,
+        quiet: bool = False,
     ) -> List[Dict[str, Any]]:
         """Search papers by category"""
         return self.search_papers(
             query=query,
             relevance_threshold=relevance_threshold,
             limit=limit,
+            quiet=quiet,
             category=category,
         )
 
@@ -544,14 +934,13 @@ class MindsDBManager:
         author: str,
         relevance_threshold: Optional[float] = None,
         limit: int = 10,
+        quiet: bool = False,
     ) -> List[Dict[str, Any]]:
         """Search papers by author (partial match supported)"""
         try:
-            escaped_query = query.replace("'", "''")
-            escaped_author = author.replace("'", "''")
             where_conditions = [
-                f"content = '{escaped_query}' ",
-                f"authors LIKE '%{escaped_author}%'",
+                f"content = {sql_literal(query)}",
+                f"authors LIKE {sql_literal(f'%{author}%')}",
             ]
 
             if relevance_threshold is not None:
@@ -571,7 +960,8 @@ class MindsDBManager:
             return result.fetch()
 
         except Exception as e:
-            console.print(f"[red]Author search error: {str(e)}[/red]")
+            if not quiet:
+                console.print(f"[red]Author search error: {str(e)}[/red]")
             return []
 
     def display_search_results(
@@ -595,6 +985,12 @@ class MindsDBManager:
 
         console.print(f"\n[bold cyan]🔍 Search Results for: '{query}'[/bold cyan]")
         console.print(f"[dim]📊 Found {len(results)} matching papers[/dim]\n")
+        console.print(self.search_results_table(results))
+
+    def search_results_table(self, results: Union[List[Dict[str, Any]], Any]) -> Table:
+        """Build the search results table without printing it"""
+        if hasattr(results, "to_dict"):
+            results = results.to_dict("records")
 
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("Relevance", style="green", width=10)
@@ -605,14 +1001,7 @@ class MindsDBManager:
         table.add_column("Summary", style="dim", width=8)
 
         for result in results:
-            metadata = result.get("metadata", {})
-            if isinstance(metadata, str):
-                import json
-
-                try:
-                    metadata = json.loads(metadata)
-                except:
-                    metadata = {}
+            metadata = parse_metadata(result.get("metadata"))
 
             relevance = result.get("relevance", 0)
             title = metadata.get("title", "N/A")
@@ -622,13 +1011,9 @@ class MindsDBManager:
             summary = metadata.get("summary", "")
 
             # Truncate long text for table display
-            title = (title[:37] + "...") if len(title) > 40 else title
-            authors = (authors[:22] + "...") if len(authors) > 25 else authors
-            research_field = (
-                (research_field[:17] + "...")
-                if len(research_field) > 20
-                else research_field
-            )
+            title = truncate(title, 40)
+            authors = truncate(authors, 25)
+            research_field = truncate(research_field, 20)
 
             # Show summary indicator
             summary_indicator = "📝" if summary else "❌"
@@ -642,7 +1027,7 @@ class MindsDBManager:
                 summary_indicator,
             )
 
-        console.print(table)
+        return table
 
     def display_paper_summary(self, paper_id: str):
         """Display detailed paper information including AI-generated summary"""
@@ -650,7 +1035,7 @@ class MindsDBManager:
             detail_query = f"""
             SELECT *
             FROM research_papers_kb
-            WHERE paper_id = '{paper_id}'
+            WHERE paper_id = {sql_literal(str(paper_id))}
             """
 
             result = self.server.query(detail_query)
@@ -663,46 +1048,26 @@ class MindsDBManager:
                 return
 
             paper_data = results[0]
-            metadata = paper_data.get("metadata", {})
-
-            if isinstance(metadata, str):
-                import json
-
-                try:
-                    metadata = json.loads(metadata)
-                except:
-                    metadata = {}
-
-            # Display paper details
-            console.print(f"\n[bold cyan]📄 Paper Details[/bold cyan]")
-            console.print(f"[bold]Title:[/bold] {metadata.get('title', 'N/A')}")
-            console.print(f"[bold]Authors:[/bold] {metadata.get('authors', 'N/A')}")
-            console.print(f"[bold]Category:[/bold] {metadata.get('category', 'N/A')}")
-            console.print(
-                f"[bold]Research Field:[/bold] {metadata.get('research_field', 'N/A')}"
-            )
-            console.print(
-                f"[bold]Publication Date:[/bold] {metadata.get('pub_date', 'N/A')}"
+            metadata = parse_metadata(paper_data.get("metadata"))
+
+            # Collect every line first and print them as one Group, so the
+            # details are rendered and flushed in a single write
+            renderables = [Text("\n📄 Paper Details", style="bold cyan")]
+            renderables.extend(
+                Text.assemble((f"{label}: ", "bold"), str(metadata.get(key, "N/A")))
+                for label, key in _PAPER_DETAIL_FIELDS
             )
-            console.print(f"[bold]Journal:[/bold] {metadata.get('journal', 'N/A')}")
-            console.print(
-                f"[bold]Citation Count:[/bold] {metadata.get('citation_count', 'N/A')}"
-            )
-
-            # Display abstract
-            console.print(f"\n[bold]Abstract:[/bold]")
-            abstract = metadata.get("abstract", "N/A")
-            console.print(f"[dim]{abstract}[/dim]")
-
-            # Display AI-generated summary
-            console.print(f"\n[bold green]🤖 AI-Generated Summary:[/bold green]")
+            renderables.append(Text("\nAbstract:", style="bold"))
+            renderables.append(Text(str(metadata.get("abstract", "N/A")), style="dim"))
+            renderables.append(Text("\n🤖 AI-Generated Summary:", style="bold green"))
             summary = metadata.get("summary", "")
             if summary:
-                console.print(f"[green]{summary}[/green]")
+                renderables.append(Text(str(summary), style="green"))
             else:
-                console.print(
-                    f"[yellow]No AI summary available for this paper.[/yellow]"
+                renderables.append(
+                    Text("No AI summary available for this paper.", style="yellow")
                 )
+            console.print(Group(*renderables))
 
         except Exception as e:
             console.print(f"[red]Error fetching paper details: {str(e)}[/red]")
@@ -713,7 +1078,7 @@ class MindsDBManager:
             detail_query = f"""
             SELECT *
             FROM research_papers_kb
-            WHERE paper_id = '{paper_id}'
+            WHERE paper_id = {sql_literal(str(paper_id))}
             """
 
             result = self.server.query(detail_query)
@@ -769,8 +1134,7 @@ class MindsDBManager:
                 }},
                 save_to = {save_to};
             """
-            project = self.server.projects.mindsdb
-            query = project.query(eval_query)
+            query = self.project.query(eval_query)
             result = query.fetch()
             console.print(
                 "[bold green]Knowledge base evaluation completed![/bold green]"
@@ -1,9 +1,85 @@
 """Research Paper model"""
 
+import os
+import struct
+import threading
+import time
+import uuid
+from collections import deque
 from dataclasses import dataclass
 
+from src.formatting import abstract_preview
 
-@dataclass
+# Random tails for new IDs, refilled 64 at a time from a single urandom call
+_RANDOM_TAIL_SIZE = 10
+_RANDOM_BATCH = 64
+_random_tails: deque = deque()
+# A forked child must not hand out the same pooled bytes as its parent
+os.register_at_fork(after_in_child=_random_tails.clear)
+
+
+def _refill_random_tails():
+    block = os.urandom(_RANDOM_TAIL_SIZE * _RANDOM_BATCH)
+    _random_tails.extend(
+        block[i : i + _RANDOM_TAIL_SIZE]
+        for i in range(0, len(block), _RANDOM_TAIL_SIZE)
+    )
+
+
+# Millisecond and counter of the last ID, so IDs generated within one
+# millisecond still sort in generation order
+_last_timestamp_ms = 0
+_counter = 0
+_id_lock = threading.Lock()
+
+
+def prefill_paper_ids():
+    """Fill the random pool ahead of time so entering papers never waits on it"""
+    if not _random_tails:
+        _refill_random_tails()
+
+
+def _random_tail() -> bytes:
+    """Take the random bytes for one ID from the pool, refilling it if empty"""
+    if not _random_tails:
+        _refill_random_tails()
+    return _random_tails.popleft()
+
+
+def new_paper_id() -> str:
+    """
+    Generate a time-ordered UUIDv7 for a new paper.
+
+    The 12 rand_a bits hold a counter within each millisecond (RFC 9562
+    method 1), so IDs from this process sort in the order they were made.
+    Sequential IDs keep knowledge base index inserts local, unlike random
+    UUIDv4 values.
+    """
+    global _last_timestamp_ms, _counter
+    with _id_lock:
+        tail = _random_tail()
+        timestamp_ms = time.time_ns() // 1_000_000
+        if timestamp_ms > _last_timestamp_ms:
+            # Seed in the lower half so a burst has room to count up
+            _counter = int.from_bytes(tail[:2], "big") & 0x7FF
+            _last_timestamp_ms = timestamp_ms
+        else:
+            # Same millisecond, or the clock stepped back: keep counting,
+            # borrowing the next millisecond once the counter runs out
+            _counter += 1
+            if _counter > 0xFFF:
+                _counter = 0
+                _last_timestamp_ms += 1
+        value = bytearray(
+            struct.pack(">Q", _last_timestamp_ms)[2:]
+            + struct.pack(">H", 0x7000 | _counter)  # version 7 + counter
+            + tail[2:]
+        )
+    value[8] = 0x80 | (value[8] & 0x3F)  # RFC 9562 variant
+    return str(uuid.UUID(bytes=bytes(value)))
+
+
+@dataclass(slots=True)
 class Paper:
     """Data class for research papers"""
 
@@ -20,3 +96,8 @@ class Paper:
     abstract: str
     summary: str = ""
     relevance_score: float = 0.0
+
+    @property
+    def abstract_preview(self) -> str:
+        """Shortened abstract for listings, cached by abstract text"""
+        return abstract_preview(self.abstract)
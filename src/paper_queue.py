@@ -0,0 +1,56 @@
+"""Write-behind queue for papers awaiting insertion"""
+
+import os
+from dataclasses import asdict
+from typing import BinaryIO, List, Optional
+
+from src.json_codec import dumps, loads
+from src.models.paper import Paper
+
+QUEUE_FILE = os.getenv("SCHOLAR_MAP_QUEUE_FILE", "papers_queue.jsonl")
+
+
+class PaperQueue:
+    """Append-only JSONL file mirroring the papers queued for insertion"""
+
+    def __init__(self, path: str = QUEUE_FILE):
+        self.path = path
+        self._file: Optional[BinaryIO] = None
+
+    def append(self, paper: Paper):
+        """Persist a queued paper immediately so it survives crashes and Ctrl+C"""
+        if self._file is None:
+            self._file = open(self.path, "ab")
+        self._file.write(dumps(asdict(paper)) + b"\n")
+        self._file.flush()
+
+    def load(self) -> List[Paper]:
+        """Load papers left over from a previous session"""
+        try:
+            with open(self.path, "rb") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return []
+
+        papers = []
+        for line in lines:
+            try:
+                papers.append(Paper(**loads(line)))
+            except (ValueError, TypeError):
+                # Blank or partially written line from an interrupted session
+                continue
+        return papers
+
+    def clear(self):
+        """Truncate the queue once its papers are inserted or discarded"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if os.path.exists(self.path):
+            open(self.path, "wb").close()
+
+    def replace(self, papers: List[Paper]):
+        """Rewrite the queue to hold only the given papers"""
+        self.clear()
+        for paper in papers:
+            self.append(paper)
@@ -0,0 +1,49 @@
+"""Cache for model responses to repeated questions"""
+
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+
+def normalize_text(text: str) -> str:
+    """Fold case, whitespace and trailing punctuation so rephrasings match"""
+    return " ".join(text.lower().split()).rstrip("?!. ")
+
+
+class ResponseCache:
+    """
+    Bounded LRU cache of model responses keyed by normalized prompt text.
+
+    Safe to share between threads, since summaries are generated from
+    executor threads during inserts.
+
+    Args:
+        max_entries: Maximum number of responses kept before the least
+            recently used one is dropped
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[str]:
+        """Return the cached response for key, or None"""
+        with self._lock:
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+            return response
+
+    def clear(self):
+        """Drop every cached response once the data behind them changes"""
+        with self._lock:
+            self._entries.clear()
+
+    def put(self, key: Hashable, response: str):
+        """Store a response, evicting the oldest entry when full"""
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
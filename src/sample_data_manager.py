@@ -1,17 +1,20 @@
 """Sample Data Manager for Scholar Map"""
 
+import asyncio
 import uuid
 from datetime import datetime, timedelta
 from typing import List
-from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Confirm
 from rich.text import Text
 
+from src.console import console
 from src.models.paper import Paper
 from src.mindsdb_manager import MindsDBManager
 
-console = Console()
+# Namespace for sample paper IDs, so each sample keeps the same ID across
+# runs and re-inserting the sample data skips papers already stored
+SAMPLE_PAPER_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "scholar-map/sample-papers")
 
 
 def create_sample_papers() -> List[Paper]:
@@ -22,7 +25,7 @@ def create_sample_papers() -> List[Paper]:
 
     sample_papers = [
         Paper(
-            paper_id=str(uuid.uuid4()),
+            paper_id="",
             title="Attention Is All You Need: A Comprehensive Study of Transformer Architecture",
             authors="Vaswani, A., Shazeer, N., Parmar, N., Uszkoreit, J., Jones, L., Gomez, A.N., Kaiser, L., Polosukhin, I.",
             category="cs.LG",
@@ -36,7 +39,7 @@ def create_sample_papers() -> List[Paper]:
             summary="This paper introduces the Transformer architecture, which uses attention mechanisms instead of recurrence or convolutions for sequence transduction. The model achieves superior performance on machine translation tasks while being more parallelizable and faster to train than previous approaches.",
         ),
         Paper(
-            paper_id=str(uuid.uuid4()),
+            paper_id="",
             title="BERT: Pre-training of Deep Bidirectional Transformers for Language Understanding",
             authors="Devlin, J., Chang, M.W., Lee, K., Toutanova, K.",
             category="cs.CL",
@@ -50,7 +53,7 @@ def create_sample_papers() -> List[Paper]:
             summary="BERT introduces bidirectional pre-training for language understanding, enabling fine-tuning with minimal additional layers to achieve state-of-the-art performance across various NLP tasks.",
         ),
         Paper(
-            paper_id=str(uuid.uuid4()),
+            paper_id="",
             title="Generative Adversarial Networks",
             authors="Goodfellow, I., Pouget-Abadie, J., Mirza, M., Xu, B., Warde-Farley, D., Ozair, S., Courville, A., Bengio, Y.",
             category="cs.LG",
@@ -64,7 +67,7 @@ def create_sample_papers() -> List[Paper]:
             summary="GANs introduce an adversarial training framework with a generator and discriminator competing in a minimax game, enabling high-quality generative modeling across various domains.",
         ),
         Paper(
-            paper_id=str(uuid.uuid4()),
+            paper_id="",
             title="ResNet: Deep Residual Learning for Image Recognition",
             authors="He, K., Zhang, X., Ren, S., Sun, J.",
             category="cs.CV",
@@ -78,7 +81,7 @@ def create_sample_papers() -> List[Paper]:
             summary="ResNet introduces residual connections that enable training of much deeper networks by learning residual functions, significantly improving image recognition performance.",
         ),
         Paper(
-            paper_id=str(uuid.uuid4()),
+            paper_id="",
             title="GPT-3: Language Models are Few-Shot Learners",
             authors="Brown, T.B., Mann, B., Ryder, N., Subbiah, M., Kaplan, J., Dhariwal, P., Neelakantan, A., Shyam, P., Sastry, G., Askell, A.",
             category="cs.CL",
@@ -92,7 +95,7 @@ def create_sample_papers() -> List[Paper]:
             summary="GPT-3 demonstrates that large language models can perform new tasks with minimal examples through few-shot learning, reducing the need for extensive fine-tuning datasets.",
         ),
         Paper(
-            paper_id=str(uuid.uuid4()),
+            paper_id="",
             title="You Only Look Once: Unified, Real-Time Object Detection",
             authors="Redmon, J., Divvala, S., Girshick, R., Farhadi, A.",
             category="cs.CV",
@@ -106,7 +109,7 @@ def create_sample_papers() -> List[Paper]:
             summary="YOLO frames object detection as a regression problem, enabling real-time detection with a single neural network evaluation, significantly improving speed over previous approaches.",
         ),
         Paper(
-            paper_id=str(uuid.uuid4()),
+            paper_id="",
             title="Neural Information Retrieval: At the End of the Early Years",
             authors="Mitra, B., Craswell, N.",
             category="cs.IR",
@@ -120,7 +123,7 @@ def create_sample_papers() -> List[Paper]:
             summary="This review discusses neural ranking models for information retrieval, highlighting how they learn language representations from raw text to improve search result ranking.",
         ),
         Paper(
-            paper_id=str(uuid.uuid4()),
+            paper_id="",
             title="Federated Learning: Challenges, Methods, and Future Directions",
             authors="Li, T., Sahu, A.K., Talwalkar, A., Smith, V.",
             category="cs.LG",
@@ -134,7 +137,7 @@ def create_sample_papers() -> List[Paper]:
             summary="Federated learning enables collaborative model training across decentralized clients while preserving data privacy, addressing critical concerns in distributed machine learning.",
         ),
         Paper(
-            paper_id=str(uuid.uuid4()),
+            paper_id="",
             title="Quantum Machine Learning: What Quantum Computing Means to Data Mining",
             authors="Biamonte, J., Wittek, P., Pancotti, N., Rebentrost, P., Wiebe, N., Lloyd, S.",
             category="physics",
@@ -148,7 +151,7 @@ def create_sample_papers() -> List[Paper]:
             summary="This paper explores quantum machine learning at the intersection of quantum physics and ML, focusing on algorithms for classical data analysis on quantum computers.",
         ),
         Paper(
-            paper_id=str(uuid.uuid4()),
+            paper_id="",
             title="Explainable AI: Interpreting, Explaining and Visualizing Deep Learning",
             authors="Samek, W., Montavon, G., Vedaldi, A., Hansen, L.K., Müller, K.R.",
             category="cs.AI",
@@ -163,6 +166,9 @@ def create_sample_papers() -> List[Paper]:
         ),
     ]
 
+    for paper in sample_papers:
+        paper.paper_id = str(uuid.uuid5(SAMPLE_PAPER_NAMESPACE, paper.title))
+
     return sample_papers
 
 
@@ -217,7 +223,7 @@ def insert_sample_papers(db_manager: MindsDBManager) -> bool:
             console.print("[yellow]Sample data insertion cancelled.[/yellow]")
             return False
 
-        # Insert papers using direct insert query
+        # Insert all sample papers with a single insert request
         console.print(
             f"\n[bold cyan]Inserting {len(sample_papers)} sample papers...[/bold cyan]"
         )
@@ -229,37 +235,23 @@ def insert_sample_papers(db_manager: MindsDBManager) -> bool:
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
                 console=console,
+                refresh_per_second=4,
+                transient=True,
             ) as progress:
                 task = progress.add_task(
                     "Processing and inserting papers into knowledge base...",
                     total=len(sample_papers),
                 )
 
-                for paper in sample_papers:
-                    insert_query = f"""
-                    INSERT INTO research_papers_kb 
-                    (paper_id, title, authors, category, pub_date, arxiv_id, journal, research_field, paper_type, citation_count, abstract, summary)
-                    VALUES (
-                        '{paper.paper_id}',
-                        '{paper.title.replace("'", "''")}',
-                        '{paper.authors.replace("'", "''")}',
-                        '{paper.category}',
-                        '{paper.pub_date}',
-                        '{paper.arxiv_id}',
-                        '{paper.journal.replace("'", "''")}',
-                        '{paper.research_field}',
-                        '{paper.paper_type}',
-                        {paper.citation_count},
-                        '{paper.abstract.replace("'", "''")}',
-                        '{paper.summary.replace("'", "''")}'
+                # Goes through the existing-ID check, so samples inserted by
+                # an earlier run are skipped rather than duplicated
+                failed = asyncio.run(
+                    db_manager.insert_papers_async(
+                        sample_papers, progress=progress, task=task
                     )
-                    """
-
-                    query = db_manager.server.query(insert_query)
-                    query.fetch()
-                    progress.advance(task)
+                )
 
-            success = True
+            success = not failed
         except Exception as e:
             console.print(f"[red]Error during insertion: {str(e)}[/red]")
             success = False
@@ -4,13 +4,12 @@ This script generates thousands of fake research papers using the Faker library
 and inserts them into the MindsDB knowledge base for performance testing.
 """
 
-import uuid
 import random
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
 import argparse
 import time
-from rich.console import Console
+from itertools import accumulate
 from rich.panel import Panel
 from rich.prompt import Confirm, IntPrompt
 from rich.text import Text
@@ -33,19 +32,27 @@ except ImportError:
     subprocess.check_call([sys.executable, "-m", "pip", "install", "faker"])
     from faker import Faker
 
-from src.models.paper import Paper
+from src.console import console
+from src.models.paper import Paper, new_paper_id
 from src.mindsdb_manager import MindsDBManager
 
-console = Console()
 fake = Faker()
 
+# Distinct first and last names generated up front for author lists
+NAME_POOL_SIZE = 1000
+
+# Publication ages over the last 10 years, more recent papers weighted higher.
+# Cumulative weights are computed once rather than on every random.choices call.
+_DAYS_AGO = range(0, 3650)
+_DAYS_AGO_CUM_WEIGHTS = list(accumulate(3650 - i for i in _DAYS_AGO))
+
 
 class KnowledgeBaseTestSuite:
     """Comprehensive testing suite for the research papers knowledge base"""
 
     def __init__(self, db_manager: MindsDBManager):
         self.db_manager = db_manager
-        self.console = Console()
+        self.console = console
         self.test_queries = [
             # Basic search queries
             "Find papers about machine learning",
@@ -626,7 +633,7 @@ class StressTestDataGenerator:
     """Generator for creating large amounts of fake research paper data"""
 
     def __init__(self):
-        self.console = Console()
+        self.console = console
         self.categories = [
             "cs.AI",
             "cs.LG",
@@ -780,6 +787,11 @@ class StressTestDataGenerator:
             "Bayesian Methods",
         ]
 
+        # Faker dispatches through its provider machinery on every call, so
+        # draw name pools once and sample them per author
+        self.first_names = [fake.first_name() for _ in range(NAME_POOL_SIZE)]
+        self.last_names = [fake.last_name() for _ in range(NAME_POOL_SIZE)]
+
     def generate_realistic_title(self) -> str:
         """Generate a realistic research paper title"""
         patterns = [
@@ -1104,8 +1116,8 @@ class StressTestDataGenerator:
 
         for _ in range(num_authors):
             # Use more realistic academic name patterns
-            first_name = fake.first_name()
-            last_name = fake.last_name()
+            first_name = random.choice(self.first_names)
+            last_name = random.choice(self.last_names)
 
             # Sometimes add middle initial
             if random.random() < 0.3:
@@ -1124,12 +1136,7 @@ class StressTestDataGenerator:
         title = self.generate_realistic_title()
 
         # Generate publication date (last 10 years, weighted toward recent)
-        days_ago = random.choices(
-            range(0, 3650),  # 10 years
-            weights=[
-                3650 - i for i in range(3650)
-            ],  # More recent papers weighted higher
-        )[0]
+        days_ago = random.choices(_DAYS_AGO, cum_weights=_DAYS_AGO_CUM_WEIGHTS)[0]
         pub_date = (datetime.now() - timedelta(days=days_ago)).strftime("%Y-%m-%d")
 
         # Generate ArXiv ID with realistic format
@@ -1146,7 +1153,7 @@ class StressTestDataGenerator:
         citation_count = max(0, base_citations + random.randint(-50, 200))
 
         return Paper(
-            paper_id=str(uuid.uuid4()),
+            paper_id=new_paper_id(),
             title=title,
             authors=self.generate_authors(),
             category=random.choice(self.categories),
@@ -1290,30 +1297,10 @@ def stress_test_insertion(
                 )
 
                 try:
-                    # Use direct insertion like in sample_data_manager
-                    for paper in batch_papers:
-                        insert_query = f"""
-                        INSERT INTO research_papers_kb 
-                        (paper_id, title, authors, category, pub_date, arxiv_id, journal, research_field, paper_type, citation_count, abstract)
-                        VALUES (
-                            '{paper.paper_id}',
-                            '{paper.title.replace("'", "''")}',
-                            '{paper.authors.replace("'", "''")}',
-                            '{paper.category}',
-                            '{paper.pub_date}',
-                            '{paper.arxiv_id}',
-                            '{paper.journal.replace("'", "''")}',
-                            '{paper.research_field}',
-                            '{paper.paper_type}',
-                            {paper.citation_count},
-                            '{paper.abstract.replace("'", "''")}'
-                        )
-                        """
-
-                        query = db_manager.server.query(insert_query)
-                        query.fetch()
-                        successful_inserts += 1
-                        progress.advance(main_task)
+                    # One insert request per batch
+                    db_manager.insert_batch(batch_papers)
+                    successful_inserts += current_batch_size
+                    progress.advance(main_task, current_batch_size)
 
                     # Calculate performance metrics
                     batch_time = time.time() - batch_start_time
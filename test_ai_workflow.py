@@ -3,12 +3,11 @@
 
 import os
 from dotenv import load_dotenv
+from src.console import console
 from src.mindsdb_manager import MindsDBManager
 from src.models.paper import Paper
-from rich.console import Console
 
 load_dotenv()
-console = Console()
 
 
 def test_ai_workflow():
@@ -58,9 +57,9 @@ def test_ai_workflow():
 
     # Test paper insertion
     console.print("\n[bold]💾 Testing paper insertion...[/bold]")
-    success = manager.insert_papers([test_paper])
+    failed = manager.insert_papers([test_paper])
 
-    if success:
+    if not failed:
         console.print("[green]✅ Paper inserted successfully[/green]")
 
         # Test search and display